@@ -2,68 +2,423 @@
 Autopilot script for automated daily lead scraping
 Runs the lead scraper automatically on a schedule
 """
+import asyncio
+import atexit
+import contextlib
+import ctypes
+import functools
+import gc
+import json
+import os
+import signal
 import time
-import schedule
-from main import LeadScraper
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.cron import CronTrigger
 import logging
+import queue
 import sys
-from datetime import datetime
-
-# Set up logging to both console and file
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler('autopilot.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
 logger = logging.getLogger(__name__)
+pipeline_logger = logging.getLogger("autopilot.pipeline")
+
+
+# Run each pipeline as a separate `python main.py` process so its memory is
+# fully reclaimed between days. Set to False to keep one LeadScraper (and
+# its Sheets/Twilio clients) alive in this process instead; _scraper,
+# _clients() and _cleanup_scraper() below are only used in that mode.
+RUN_PIPELINE_IN_SUBPROCESS = True
+MAIN_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")
+
+# When the autopilot is stopped mid-run, the child gets this long to shut
+# down after SIGTERM before it (and its Chrome processes) are killed
+PIPELINE_STOP_TIMEOUT_SECONDS = 15
+
+# The `python main.py` child of the run in progress (subprocess mode), and
+# the daily_job task driving it
+_pipeline_process = None
+_job_task = None
+
+# A run that takes longer than this is treated as hung
+PIPELINE_TIMEOUT_SECONDS = 6 * 3600
+
+# After this many failed runs in a row, skip scheduled runs for a while
+# (doubling the pause on every further failure, up to a week) instead of
+# relaunching a broken setup every day
+CIRCUIT_BREAKER_FAIL_MAX = 3
+CIRCUIT_BREAKER_MAX_SKIPPED_RUNS = 7
+
+_consecutive_failures = 0
+_runs_to_skip = 0
+
+# The idle scheduler runs niced on a single core; scheduled runs get every
+# core back and a small priority boost (the nice is skipped when the process
+# isn't allowed to raise its priority again)
+SCHEDULER_NICE = 10
+JOB_PRIORITY_BOOST = 5
+
+_all_cpus = None
+
+# In-process mode only (RUN_PIPELINE_IN_SUBPROCESS = False): created on the
+# first run and reused afterwards, so the Google Sheets and Twilio clients
+# (and their HTTP connection pools) survive between runs
+_scraper = None
+# In-process mode only: the pipeline of a run that timed out. Its worker
+# thread can't be cancelled, so no new run starts until it has finished.
+_timed_out_run = None
+
+
+@functools.lru_cache(maxsize=1)
+def _clients():
+    """
+    Connect to Google Sheets and Twilio once per process.
+    Both clients refresh their auth tokens on their own, so they can be
+    handed to every LeadScraper we create instead of re-authenticating.
+    Only used in in-process mode (RUN_PIPELINE_IN_SUBPROCESS = False).
+    """
+    from main import create_sheets_manager, create_sms_sender
+    return create_sheets_manager(), create_sms_sender()
+
+
+def _cleanup_scraper():
+    # Nothing to do in subprocess mode: _scraper is never created there
+    if _scraper:
+        _scraper.cleanup()
+
+
+atexit.register(_cleanup_scraper)
+
+
+def _release_memory():
+    """Free garbage left by a run and hand unused heap pages back to the OS"""
+    gc.collect()
+    try:
+        ctypes.CDLL("libc.so.6").malloc_trim(0)
+    except (OSError, AttributeError):
+        pass  # not glibc (e.g. macOS)
+
+
+def _pin_scheduler():
+    """Lower the scheduler's priority and confine it to one core"""
+    global _all_cpus
+    if hasattr(os, "nice"):
+        # Runs (worker threads and the main.py child) inherit our nice value,
+        # and without CAP_SYS_NICE it can never be lowered again - so only
+        # deprioritise the scheduler when _job_priority can undo it
+        try:
+            os.nice(-1)
+            os.nice(1)
+        except OSError:
+            logger.debug("Not allowed to raise priority; leaving the scheduler's nice value alone")
+        else:
+            os.nice(SCHEDULER_NICE)
+    if hasattr(os, "sched_setaffinity"):
+        try:
+            _all_cpus = os.sched_getaffinity(0)
+            os.sched_setaffinity(0, {min(_all_cpus)})
+        except OSError as e:
+            logger.debug(f"Could not set CPU affinity: {e}")
+            _all_cpus = None
+
+
+@contextlib.contextmanager
+def _job_priority():
+    """Give a scheduled run all cores back, and a priority boost if permitted"""
+    boosted = False
+    if hasattr(os, "nice"):
+        try:
+            os.nice(-JOB_PRIORITY_BOOST)
+            boosted = True
+        except OSError:
+            pass  # raising priority needs CAP_SYS_NICE
+    if _all_cpus:
+        try:
+            os.sched_setaffinity(0, _all_cpus)
+        except OSError as e:
+            logger.debug(f"Could not widen CPU affinity: {e}")
+    try:
+        yield
+    finally:
+        if _all_cpus:
+            try:
+                os.sched_setaffinity(0, {min(_all_cpus)})
+            except OSError as e:
+                logger.debug(f"Could not restore CPU affinity: {e}")
+        if boosted:
+            try:
+                os.nice(JOB_PRIORITY_BOOST)
+            except OSError as e:
+                logger.debug(f"Could not restore scheduler priority: {e}")
+
+
+async def _run_pipeline_in_process():
+    """Run one pipeline on the long-lived LeadScraper in this process"""
+    global _scraper, _timed_out_run
+
+    if _timed_out_run is not None:
+        if not _timed_out_run.done():
+            raise RuntimeError("The run that timed out is still going in its worker thread - not starting another")
+        if not _timed_out_run.cancelled() and _timed_out_run.exception():
+            logger.warning(f"The run that timed out ended with: {_timed_out_run.exception()}")
+        # Its browser was closed; start over with a new LeadScraper
+        _timed_out_run = None
+        _scraper = None
+
+    if _scraper is None:
+        # Imported here so the scheduler starts quickly and doesn't load
+        # Selenium, gspread and Twilio until the first run is due
+        from main import LeadScraper
+        sheets_manager, sms_sender = _clients()
+        _scraper = LeadScraper(sheets_manager=sheets_manager, sms_sender=sms_sender)
+    # The sheets manager outlives runs (and LeadScrapers), and the sheet may
+    # have been edited by hand since the last one
+    _scraper.sheets_manager.clear_caches()
+    # The browser is closed at the end of every run to free its memory.
+    run = asyncio.ensure_future(
+        _scraper.run_full_pipeline_async(send_sms=False)  # Set to True if you want automatic SMS
+    )
+    try:
+        # Shielded so a timeout leaves `run` tracking the worker thread
+        await asyncio.wait_for(asyncio.shield(run), timeout=PIPELINE_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        # The worker thread can't be cancelled; quitting the driver makes its
+        # next Selenium call fail so it unwinds. The next run starts fresh
+        # once it has.
+        _scraper.cleanup()
+        _timed_out_run = run
+        raise
 
 
-def daily_job():
-    """Main job function that runs the scraping pipeline"""
+async def _run_pipeline_subprocess():
+    """
+    Run one pipeline as `python main.py` in a child process. Everything the
+    run allocated goes back to the OS when the child exits, and a hung run
+    can be killed outright (together with its Chrome processes).
+    """
+    global _pipeline_process
+
+    # start_new_session also means a Ctrl+C in the terminal never reaches the
+    # child; main() stops it through _shutdown() instead
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, MAIN_SCRIPT,
+        cwd=os.path.dirname(MAIN_SCRIPT),
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        start_new_session=True,  # own process group, so Chrome is killed with it
+        # stdout is a pipe; unbuffered keeps print() output in step with the log lines
+        env={**os.environ, "PYTHONUNBUFFERED": "1"},
+    )
+    _pipeline_process = process
+
+    async def forward_output():
+        async for line in process.stdout:
+            pipeline_logger.info(line.decode(errors="replace").rstrip())
+
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(forward_output(), process.wait()),
+            timeout=PIPELINE_TIMEOUT_SECONDS,
+        )
+    except asyncio.TimeoutError:
+        os.killpg(process.pid, signal.SIGKILL)
+        await process.wait()
+        raise
+    finally:
+        if process.returncode is not None:
+            _pipeline_process = None
+
+    if process.returncode != 0:
+        raise RuntimeError(f"Pipeline process exited with code {process.returncode}")
+
+
+def _signal_pipeline(sig):
+    """Send sig to the running `main.py` child's process group; False if there is none"""
+    process = _pipeline_process
+    if process is None or process.returncode is not None:
+        return False
+    try:
+        os.killpg(process.pid, sig)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+async def _shutdown(loop):
+    """
+    Stop a running `main.py` child (Chrome included) and let its daily_job
+    finish up while the loop is still running, then stop the loop.
+    """
+    process = _pipeline_process
+    if _signal_pipeline(signal.SIGTERM):
+        logger.info("Stopping the running pipeline process...")
+        try:
+            await asyncio.wait_for(process.wait(), PIPELINE_STOP_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Pipeline process did not exit within {PIPELINE_STOP_TIMEOUT_SECONDS}s - killing it"
+            )
+        try:
+            # Also catches Chrome processes that outlived main.py itself
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        await process.wait()
+        if _job_task:
+            await asyncio.wait({_job_task}, timeout=PIPELINE_STOP_TIMEOUT_SECONDS)
+    loop.stop()
+
+
+async def daily_job():
+    """Main job coroutine that runs the scraping pipeline"""
+    global _consecutive_failures, _runs_to_skip, _job_task
+
+    if _runs_to_skip > 0:
+        _runs_to_skip -= 1
+        logger.warning(
+            f"⏸️  Skipping daily job after {_consecutive_failures} consecutive failures "
+            f"({_runs_to_skip} more runs will be skipped)"
+        )
+        return
+
     logger.info("=" * 70)
-    logger.info(f"🚀 Starting daily lead scraping job at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    logger.info(f"🚀 Starting daily lead scraping job at {time.strftime('%Y-%m-%d %H:%M:%S')}")
     logger.info("=" * 70)
     
-    scraper = None
+    started = time.monotonic()
+    succeeded = False
+    _job_task = asyncio.current_task()
     try:
-        scraper = LeadScraper()
         # This will:
         # - scrape leads
         # - save to Google Sheets
         # - send SMS if send_sms=True (set to False to skip SMS)
-        scraper.run_full_pipeline(send_sms=False)  # Set to True if you want automatic SMS
+        # Worker threads, the child process and the browser inherit the
+        # job's affinity and priority
+        with _job_priority():
+            if RUN_PIPELINE_IN_SUBPROCESS:
+                await _run_pipeline_subprocess()
+            else:
+                await _run_pipeline_in_process()
+        succeeded = True
         logger.info("✅ Daily job completed successfully!")
+    except asyncio.TimeoutError:
+        logger.error(f"❌ Daily job timed out after {PIPELINE_TIMEOUT_SECONDS / 3600:.0f}h - stopped the scraper")
     except KeyboardInterrupt:
         logger.warning("⚠️  Job interrupted by user")
     except Exception as e:
         logger.error(f"❌ Error in daily job: {e}", exc_info=True)
     finally:
-        if scraper:
-            scraper.cleanup()
-        logger.info(f"🏁 Daily job finished at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        if succeeded:
+            _consecutive_failures = 0
+        else:
+            _consecutive_failures += 1
+            if _consecutive_failures >= CIRCUIT_BREAKER_FAIL_MAX:
+                _runs_to_skip = min(
+                    2 ** (_consecutive_failures - CIRCUIT_BREAKER_FAIL_MAX),
+                    CIRCUIT_BREAKER_MAX_SKIPPED_RUNS,
+                )
+                logger.warning(
+                    f"⚠️  {_consecutive_failures} consecutive failures - skipping the next {_runs_to_skip} runs"
+                )
+        _job_task = None
+        _release_memory()
+        elapsed_minutes = (time.monotonic() - started) / 60
+        logger.info(f"🏁 Daily job finished at {time.strftime('%Y-%m-%d %H:%M:%S')} (took {elapsed_minutes:.1f} min)")
         logger.info("=" * 70 + "\n")
 
 
-# Schedule the job to run every day at 10:00 AM (local time)
-# You can change this to any time you want
-schedule.every().day.at("10:00").do(daily_job)
+class JsonLogFormatter(logging.Formatter):
+    """Format each record as one JSON object per line"""
 
-# Optional: Add a test run immediately (comment out if you don't want this)
-# logger.info("Running initial test job...")
-# daily_job()
+    def format(self, record):
+        # Tracebacks are already part of the message: QueueHandler formats
+        # them in before the record is queued
+        return json.dumps({
+            "time": self.formatTime(record),
+            "logger": record.name,
+            "level": record.levelname,
+            "message": record.getMessage(),
+        }, ensure_ascii=False)
+
+
+def setup_logging():
+    """
+    Log to both console and file.
+    Log calls only put records on a queue; a background listener thread does
+    the actual writes, and the log file is rotated at 10 MB (7 backups kept).
+    The file gets one JSON object per line so log shippers can ingest it
+    without parsing; the console stays human readable.
+    """
+    file_handler = RotatingFileHandler('autopilot.log', maxBytes=10 * 1024 * 1024, backupCount=7)
+    file_handler.setFormatter(JsonLogFormatter())
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(
+        logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    )
+
+    log_queue = queue.Queue(-1)
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))  # listener handlers add the real format
+    log_listener = QueueListener(log_queue, file_handler, console_handler)
+    logging.basicConfig(
+        level=logging.INFO,
+        handlers=[queue_handler]
+    )
+    log_listener.start()
+    atexit.register(log_listener.stop)
+
+
+def main():
+    """Start the scheduler and run until interrupted"""
+    setup_logging()
+
+    # The event loop sleeps until the next fire time - no polling loop needed
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    scheduler = AsyncIOScheduler(event_loop=loop)
+
+    # Schedule the job to run every day at 10:00 AM (local time)
+    # You can change this to any time you want
+    scheduler.add_job(
+        daily_job,
+        CronTrigger(hour=10, minute=0),
+        misfire_grace_time=3600,  # still run if we wake up within an hour of 10:00
+        coalesce=True,  # collapse missed runs (e.g. laptop asleep) into one
+        max_instances=1,  # never overlap runs
+    )
+
+    # Optional: Add a test run immediately (comment out if you don't want this)
+    # logger.info("Running initial test job...")
+    # scheduler.add_job(daily_job)
+
+    shutdown_task = None
+
+    def _stop_on_signal(signame):
+        nonlocal shutdown_task
+        if shutdown_task is None:
+            logger.info(f"Received {signame}, stopping scheduler...")
+            shutdown_task = loop.create_task(_shutdown(loop))
+        elif _signal_pipeline(signal.SIGKILL):
+            logger.warning(f"Received {signame} again, killing the pipeline process")
+
+    # Signals are delivered through the event loop's wakeup fd, so the selector
+    # returns immediately on Ctrl+C / SIGTERM even while sleeping until 10:00
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, _stop_on_signal, sig.name)
+    scheduler.start()
+
+    logger.info("🤖 Autopilot scheduler started!")
+    _pin_scheduler()
+    logger.info(f"⏰ Next scheduled run: {scheduler.get_jobs()[0].next_run_time}")
+    logger.info("📝 Logs are being saved to 'autopilot.log'")
+    logger.info("Press Ctrl+C to stop the scheduler\n")
+
+    try:
+        loop.run_forever()
+    finally:
+        scheduler.shutdown(wait=False)
+        logger.info("👋 Autopilot scheduler stopped")
 
-logger.info("🤖 Autopilot scheduler started!")
-logger.info(f"⏰ Next scheduled run: {schedule.next_run()}")
-logger.info("📝 Logs are being saved to 'autopilot.log'")
-logger.info("Press Ctrl+C to stop the scheduler\n")
 
-try:
-    while True:
-        schedule.run_pending()
-        time.sleep(60)  # Check every minute
-except KeyboardInterrupt:
-    logger.info("\n👋 Autopilot scheduler stopped by user")
-    sys.exit(0)
+if __name__ == "__main__":
+    main()
@@ -9,11 +9,19 @@ Clicks into each business and collects:
 - rating
 """
 
+import atexit
+import itertools
 import logging
+import os
+import queue
 import re
 import time
 import random
+import subprocess
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from urllib.parse import quote_plus
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
@@ -28,17 +36,264 @@ from selenium.common.exceptions import (
     TimeoutException,
 )
 from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.core.constants import DEFAULT_USER_HOME_CACHE_PATH
+from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Resources we never need for scraping text. Blocking them cuts page-load
+# bandwidth and browser memory. CSS is left alone: the results feed is only
+# scrollable with the page styles applied.
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*/maps/vt*",  # map tiles
+    "*googleusercontent.com*",  # business photos
+    "*streetviewpixels*",
+]
+
+# Regexes used on every result card, compiled once
+DIGIT_RE = re.compile(r"\d")
+PHONE_NUMBER_RE = re.compile(r"(\+?\d[\d\-\.\s\(\)]{7,}\d)")
+PHONE_LIKE_RE = re.compile(r"\d{3}.*\d{3}.*\d{4}")
+# Tried in order on the card text. The US pattern also covers the plain
+# "(555) 555-5555" and "555.555.5555" forms, so only international is left.
+PHONE_TEXT_PATTERNS = (
+    re.compile(r"(\+?1?[\s\-\.]?\(?\d{3}\)?[\s\-\.]?\d{3}[\s\-\.]?\d{4})"),  # US format
+    re.compile(r"(\+\d{1,3}[\s\-\.]?\d{1,4}[\s\-\.]?\d{1,4}[\s\-\.]?\d{1,9})"),  # International
+)
+RATING_STAR_RE = re.compile(r"(\d\.\d)\s*★")
+RATING_OUT_OF_RE = re.compile(r"Rated\s+(\d\.\d)\s+out of")
+URL_RE = re.compile(r"(https?://[^\s]+)")
+# Label prefixes Maps puts in front of phone numbers ("tel:", "Phone:", "Call:")
+PHONE_PREFIX_RE = re.compile(r"^(?:(?:tel:|Phone:|Call:)\s*)+")
+# A card line with a digit and a street word (case-insensitive) is taken as the address
+ADDRESS_LINE_RE = re.compile(
+    r"^(?=.*\d).*\b(?:St|Street|Ave|Avenue|Blvd|Road|Rd|Dr|Drive|Lane|Ln)\b",
+    re.IGNORECASE,
+)
+
+# For each field in {field: [[by, selector, attr], ...]}, returns the first
+# non-empty text/attribute among its candidates (By.XPATH or By.CSS_SELECTOR)
+# or null, mirroring WebElement.text and get_attribute (which prefers the DOM
+# property, e.g. a resolved href)
+TEXT_PROBE_JS = """
+const probe = (candidates) => {
+    for (const [by, selector, attr] of candidates) {
+        let el = null;
+        try {
+            el = by === "xpath"
+                ? document.evaluate(selector, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+                : document.querySelector(selector);
+        } catch (e) {
+            continue;
+        }
+        if (!el) continue;
+        let text;
+        if (!attr) text = el.innerText;
+        else if (typeof el[attr] === "string") text = el[attr];
+        else text = el.getAttribute(attr);
+        if (text && text.trim()) return text.trim();
+    }
+    return null;
+};
+const found = {};
+for (const [field, candidates] of Object.entries(arguments[0])) {
+    found[field] = probe(candidates);
+}
+return found;
+"""
+
+# First of data-result-id / aria-label / first text line, read in one call.
+# textContent avoids the layout pass that WebElement.text triggers.
+CARD_IDENTIFIER_JS = """
+const card = arguments[0];
+return card.getAttribute("data-result-id")
+    || card.getAttribute("aria-label")
+    || (card.textContent || "").trim().split("\\n", 1)[0];
+"""
+
+# Scrolls the results feed to the bottom and returns the previous scrollTop.
+# A MutationObserver on the feed counts nodes Google Maps appends, so the
+# scroll loop can wait for the list to actually grow instead of sleeping.
+SCROLL_FEED_JS = """
+const feed = arguments[0];
+if (!feed.__cardObserver) {
+    feed.__cardObserver = new MutationObserver(records => {
+        for (const record of records) feed.__nodesAdded += record.addedNodes.length;
+    });
+    feed.__cardObserver.observe(feed, {childList: true, subtree: true});
+}
+feed.__nodesAdded = 0;
+const before = feed.scrollTop;
+feed.scrollTop = feed.scrollHeight;
+return before;
+"""
+FEED_NODES_ADDED_JS = "return (arguments[0].__nodesAdded || 0) > 0;"
+
+# Fallback selectors for the results list and its cards, most specific first
+RESULTS_CONTAINER_SELECTORS = (
+    "div[aria-label*='Results'] div[role='feed']",
+    "div[role='feed']",
+    "div.section-layout.section-scrollbox",
+)
+RESULT_CARD_SELECTORS = (
+    "div[role='article']",
+    "div[class*='Nv2PK']",
+    "div[jsaction*='mouseover:pane']",
+)
+
+# Poll interval for enrichment waits. Detail-panel elements usually render in
+# well under Selenium's default 0.5s poll, which would otherwise be the floor.
+DETAIL_POLL_SECONDS = 0.1
+
+# Detail-panel locators for _wait_and_get_texts: (By, selector, attribute),
+# attribute None means the element text. Tried in order.
+DETAIL_PHONE_CANDIDATES = (
+    (By.CSS_SELECTOR, "button[aria-label*='Phone:']", "aria-label"),
+    (By.CSS_SELECTOR, "button[aria-label*='Call:']", "aria-label"),
+    (By.CSS_SELECTOR, "button[data-item-id*='phone:tel'] div[class*='fontBodyMedium']", None),
+    (By.CSS_SELECTOR, "button[data-item-id*='phone:tel']", None),
+    (By.CSS_SELECTOR, "a[href^='tel:']", "href"),
+    (By.CSS_SELECTOR, "button[data-value*='Phone']", None),
+    (By.CSS_SELECTOR, "div[data-value*='Phone']", None),
+    (By.CSS_SELECTOR, "span[class*='phone']", None),
+    (By.CSS_SELECTOR, "div[class*='phone']", None),
+    (By.CSS_SELECTOR, "button[data-item-id*='phone']", None),
+    # Label text followed by the number needs XPath's sibling axis
+    (By.XPATH, "//*[contains(text(),'Phone') or contains(text(),'Call')]/following-sibling::*[1]", None),
+    # Additional fallbacks
+    (By.CSS_SELECTOR, "button[jsaction*='phone']", None),
+    (By.CSS_SELECTOR, "div[jsaction*='phone']", None),
+)
+DETAIL_WEBSITE_CANDIDATES = (
+    (By.CSS_SELECTOR, "a[aria-label*='Website']", "href"),
+    (By.CSS_SELECTOR, "a[data-item-id*='authority']", "href"),
+    (By.CSS_SELECTOR, "a[href*='http']:not([href*='google.com/maps'])", "href"),
+    (By.CSS_SELECTOR, "button[aria-label*='Website']", "aria-label"),
+    (By.CSS_SELECTOR, "button[data-item-id*='authority']", None),
+    # Label text followed by the link needs XPath's sibling axis
+    (By.XPATH, "//*[contains(text(),'Website')]/following-sibling::a[1]", "href"),
+    (By.CSS_SELECTOR, "[class*='website'] a", "href"),
+)
+
+# Close button of the place detail pane (returns to the results list in place)
+DETAIL_CLOSE_BUTTON_SELECTOR = "button[aria-label='Close'], button[jsaction*='pane.close']"
+
+# Search box locators, tried in order
+SEARCH_BOX_SELECTORS = (
+    (By.ID, "searchboxinput"),
+    (By.CSS_SELECTOR, "input[placeholder*='Search'], input[aria-label*='Search']"),
+)
+
+# First non-empty text line (the business name) of each card in arguments[0]
+CARD_NAMES_JS = """
+return arguments[0].map(card => {
+    for (const line of (card.innerText || "").split("\\n")) {
+        if (line.trim()) return line.trim();
+    }
+    return "";
+});
+"""
+
+# Consent dialog buttons, matched by attribute rather than a text-scanning XPath
+CONSENT_BUTTON_SELECTOR = (
+    "button[aria-label='Accept all'], button[aria-label='I agree'], "
+    "button[jsname='b3VHJd'], form[action*='consent'] button"
+)
+
+# True when a visible CAPTCHA (or Google's /sorry/ block page) is showing.
+# One in-page check instead of XPath sweeps and a page_source download.
+CAPTCHA_JS = """
+if (location.pathname.startsWith("/sorry")) return true;
+const found = document.querySelectorAll(
+    "iframe[src*='recaptcha'], .g-recaptcha, [id*='recaptcha'], [class*='captcha']"
+);
+return Array.from(found).some(el => el.getClientRects().length > 0);
+"""
+
+# search_businesses reuses the loaded Maps app for new queries and only does
+# a full reload (through about:blank, to free the old page) this often
+MAX_QUERIES_PER_PAGE_LOAD = 50
+
+# Long sessions grow Chrome's memory: clear its cache/cookies/history every
+# BROWSER_CLEANUP_QUERIES searches and restart the browser every BROWSER_RECYCLE_QUERIES
+BROWSER_CLEANUP_QUERIES = 25
+BROWSER_RECYCLE_QUERIES = 100
+
+# How long to wait for someone to solve a CAPTCHA in the browser window
+CAPTCHA_WAIT_SECONDS = 300
+
+# Keep-alive connections each driver may hold open to its chromedriver.
+# Selenium's default pool keeps one, so overlapping commands open new sockets.
+DRIVER_HTTP_POOL_MAXSIZE = 10
+
+# Reads everything _extract_from_card needs from a result card in one
+# WebDriver round-trip instead of a find_elements/get_attribute call per field
+CARD_EXTRACT_JS = """
+const card = arguments[0];
+const all = (selector) => Array.from(card.querySelectorAll(selector));
+return {
+    text: card.innerText || "",
+    telHrefs: all("a[href^='tel:']").map(a => a.href || ""),
+    phoneButtons: all(
+        "button[data-item-id*='phone'], button[aria-label*='Phone'], button[aria-label*='Call']"
+    ).map(b => ({aria: b.getAttribute("aria-label") || "", text: b.innerText || ""})),
+    ariaLabels: all("[aria-label]").map(e => e.getAttribute("aria-label")),
+    websiteHrefs: all(
+        "a[href^='http'], a[data-item-id='authority'], a[aria-label*='Website'], a[aria-label*='website']"
+    ).map(a => a.href || ""),
+    websiteAriaLabels: all(
+        "button[aria-label*='Website'], button[aria-label*='website'], button[data-item-id*='authority']"
+    ).map(b => b.getAttribute("aria-label") || ""),
+};
+"""
+
+
+class CaptchaDetected(Exception):
+    """Raised when a CAPTCHA blocks the page and nobody can solve it"""
+
 
 class GoogleMapsScraper:
-    def __init__(self, headless: bool = True):
+    # chromedriver binary, resolved by the first scraper in the process
+    _driver_path = None
+
+    def __init__(
+        self,
+        headless: bool = True,
+        max_queries_per_page_load: int = MAX_QUERIES_PER_PAGE_LOAD,
+        unattended: bool = False,
+    ):
+        """
+        Args:
+            headless: Run Chrome without a window
+            max_queries_per_page_load: Searches typed into the loaded Maps page
+                before it is reloaded from scratch (1 = reload for every search)
+            unattended: Raise CaptchaDetected on a CAPTCHA instead of waiting
+                for it to be solved in the browser
+        """
         self.driver = None
         self.headless = headless
+        self.unattended = unattended
+        self.max_queries_per_page_load = max(1, max_queries_per_page_load)
+        self._maps_loaded = False
+        self._queries_since_page_load = 0
+        self._query_count = 0
+        self._consent_handled = False
+        self._container_selector = None
+        self._cards_selector = None
+        self._observer_misses = 0
+        # Quit Chrome on interpreter exit even if the caller never closes us
+        atexit.register(self.close)
         self.setup_driver()
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
     def setup_driver(self):
         chrome_options = Options()
         if self.headless:
@@ -54,12 +309,93 @@ class GoogleMapsScraper:
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
         
+        # Don't download or decode images (text is all we scrape)
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_experimental_option(
+            "prefs", {"profile.managed_default_content_settings.images": 2}
+        )
+
         # Updated user agent to latest Chrome version
         chrome_options.add_argument(
             "user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
             "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
         )
 
+        driver_path = self._resolve_driver_path()
+
+        # chromedriver logging off and discarded, so a long-running browser
+        # never blocks on a full log pipe; keep-alive reuses the HTTP connection
+        service = Service(
+            str(driver_path),
+            service_args=["--log-level=OFF"],
+            log_output=subprocess.DEVNULL,
+        )
+        self.driver = webdriver.Chrome(service=service, options=chrome_options, keep_alive=True)
+        self._consent_handled = False
+        self._maps_loaded = False
+        self._tune_connection_pool()
+        
+        # Execute script to remove webdriver property (anti-detection)
+        self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
+            'source': '''
+                Object.defineProperty(navigator, 'webdriver', {
+                    get: () => undefined
+                });
+            '''
+        })
+        
+        # Block images, fonts and map tiles before the first page load
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+
+        logger.info("Chrome WebDriver successfully initialized with anti-detection measures.")
+
+    @staticmethod
+    def _find_cached_driver():
+        """Newest cached chromedriver matching the installed Chrome's major version, or None"""
+        try:
+            version = OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+        except Exception:
+            return None
+        if not version:
+            return None
+        major = version.split(".")[0]
+
+        # Layout: <cache>/drivers/chromedriver/<os>/<version>/[chromedriver-<os>/]chromedriver
+        os_dirs = Path(DEFAULT_USER_HOME_CACHE_PATH, "drivers", "chromedriver")
+        found = []
+        for version_dir in os_dirs.glob(f"*/{major}.*"):
+            try:
+                key = tuple(int(part) for part in version_dir.name.split("."))
+            except ValueError:
+                continue
+            for name in ("chromedriver", "chromedriver.exe"):
+                for binary in version_dir.rglob(name):
+                    if binary.is_file():
+                        found.append((key, binary))
+        return max(found)[1] if found else None
+
+    @classmethod
+    def _resolve_driver_path(cls) -> Path:
+        """
+        Find (and if needed download) chromedriver once per process.
+        Set CHROMEDRIVER_PATH to use an installed binary and skip webdriver-manager.
+        """
+        if cls._driver_path is not None:
+            return cls._driver_path
+
+        env_path = os.getenv("CHROMEDRIVER_PATH")
+        if env_path:
+            cls._driver_path = Path(env_path)
+            return cls._driver_path
+
+        # A driver webdriver-manager already downloaded for this Chrome saves its
+        # network version check; FORCE_DRIVER_REFRESH=1 always asks it again
+        cached = None if os.getenv("FORCE_DRIVER_REFRESH") else cls._find_cached_driver()
+        if cached:
+            cls._driver_path = cached
+            return cls._driver_path
+
         driver_path = Path(ChromeDriverManager().install())
 
         # Newer Chrome-for-Testing bundles sometimes point to the THIRD_PARTY notice file.
@@ -77,19 +413,8 @@ class GoogleMapsScraper:
         # Ensure the binary is executable
         driver_path.chmod(driver_path.stat().st_mode | 0o111)
 
-        service = Service(str(driver_path))
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
-        
-        # Execute script to remove webdriver property (anti-detection)
-        self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
-            'source': '''
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined
-                });
-            '''
-        })
-        
-        logger.info("Chrome WebDriver successfully initialized with anti-detection measures.")
+        cls._driver_path = driver_path
+        return driver_path
 
     def close(self):
         if self.driver:
@@ -98,34 +423,153 @@ class GoogleMapsScraper:
                 logger.info("Chrome driver closed successfully.")
             except Exception as e:
                 logger.error(f"Error closing driver: {e}")
+            finally:
+                self.driver = None
 
     # ---------- helpers ----------
 
-    def _wait_and_get_text(self, candidates, timeout=8):
+    def _tune_connection_pool(self):
+        """
+        Rebuild the driver's urllib3 pool with DRIVER_HTTP_POOL_MAXSIZE connections.
+        webdriver.Chrome does not accept a ClientConfig, so the pool settings
+        are applied to its RemoteConnection after the fact. That goes through
+        private RemoteConnection attributes, so each one is looked up first and
+        the default pool is kept (and logged) if a Selenium upgrade moved it.
         """
-        candidates: list of tuples (By, selector, attribute)
+        executor = self.driver.command_executor
+        client_config = getattr(executor, "client_config", None)  # Selenium 4.26+
+        old_conn = getattr(executor, "_conn", None)
+        get_connection_manager = getattr(executor, "_get_connection_manager", None)
+        if client_config is None or old_conn is None or get_connection_manager is None:
+            logger.info("This Selenium version has no pool hooks we know of; keeping the default WebDriver connection pool.")
+            return
+        if not getattr(client_config, "keep_alive", False):
+            return
+        try:
+            # Selenium reads the pool kwargs from this nested key
+            client_config.init_args_for_pool_manager = {
+                "init_args_for_pool_manager": {"maxsize": DRIVER_HTTP_POOL_MAXSIZE}
+            }
+            new_conn = get_connection_manager()
+        except Exception as e:
+            logger.info(f"Could not resize the WebDriver connection pool ({e}); keeping the default one.")
+            return
+        executor._conn = new_conn
+        old_conn.clear()
+
+    def _wait_and_get_texts(self, candidates_by_field, timeout=8):
+        """
+        candidates_by_field: dict of field -> list of tuples (By, selector, attribute)
         attr can be None to use element.text
+        Every field is probed in the page by one script call per poll, until
+        all of them have a value or `timeout` runs out. Missing fields are "N/A".
         """
+        # The candidate tuples go to the page as-is (serialized as JSON arrays)
+        pending = dict(candidates_by_field)
+        found = {}
         end_time = time.time() + timeout
-        while time.time() < end_time:
-            for by, selector, attr in candidates:
-                try:
-                    el = self.driver.find_element(by, selector)
-                    text = el.get_attribute(attr) if attr else el.text
-                    if text:
-                        text = text.strip()
-                        if text:
-                            return text
-                except Exception:
-                    continue
-            time.sleep(0.3)
-        return "N/A"
+        while pending and time.time() < end_time:
+            try:
+                texts = self.driver.execute_script(TEXT_PROBE_JS, pending)
+            except Exception:
+                texts = {}
+            for field, text in texts.items():
+                if text:
+                    found[field] = text
+                    del pending[field]
+            if pending:
+                time.sleep(DETAIL_POLL_SECONDS)
+        return {field: found.get(field, "N/A") for field in candidates_by_field}
+
+    def _wait_for_more_cards(self, previous_count, timeout=3):
+        """
+        Wait until more than `previous_count` result cards are rendered.
+        Returns the cards, or an empty list if none appeared in time.
+        """
+        def more_cards_rendered(driver):
+            cards = self._find_result_cards()
+            return cards if len(cards) > previous_count else False
+
+        try:
+            return WebDriverWait(self.driver, timeout, poll_frequency=0.25).until(
+                more_cards_rendered
+            )
+        except TimeoutException:
+            return []
+
+    def _wait_for_staleness(self, element, timeout=5):
+        """Wait for an element to be removed from the page (e.g. a dismissed popup)"""
+        try:
+            WebDriverWait(self.driver, timeout).until(EC.staleness_of(element))
+        except TimeoutException:
+            pass
+
+    def _accept_consent(self, context=""):
+        """
+        Click the cookie/consent button if it shows up within a second.
+        Only checked once per browser: the choice is kept in its cookies.
+        """
+        if self._consent_handled:
+            return
+        self._consent_handled = True
+        try:
+            consent_button = WebDriverWait(self.driver, 1, poll_frequency=0.2).until(
+                EC.element_to_be_clickable((By.CSS_SELECTOR, CONSENT_BUTTON_SELECTOR))
+            )
+        except TimeoutException:
+            return
+        consent_button.click()
+        logger.info(f"Clicked consent/accept button{context}.")
+        self._wait_for_staleness(consent_button)
+
+    def _captcha_present(self) -> bool:
+        try:
+            return bool(self.driver.execute_script(CAPTCHA_JS))
+        except Exception:
+            return False
+
+    def _recycle_browser_if_due(self):
+        """Count this search and clear or restart the browser when it is due"""
+        self._query_count += 1
+        if self._query_count > BROWSER_RECYCLE_QUERIES:
+            logger.info(f"♻️  Restarting Chrome after {BROWSER_RECYCLE_QUERIES} searches to free memory")
+            self.close()
+            self.setup_driver()
+            self._query_count = 1
+        elif self._query_count % BROWSER_CLEANUP_QUERIES == 0:
+            try:
+                self.driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+                self.driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+                self.driver.execute_cdp_cmd("Page.resetNavigationHistory", {})
+                self._consent_handled = False  # the consent cookie is gone too
+                logger.debug("Cleared browser cache, cookies and history.")
+            except Exception as e:
+                logger.debug(f"Could not clear browser state: {e}")
+
+    def _wait_captcha_resolved(self, context="", timeout=CAPTCHA_WAIT_SECONDS) -> bool:
+        """
+        Wait for a CAPTCHA to be solved in the browser window.
+
+        Returns: True once it is gone, False if it is still there after `timeout`
+        Raises: CaptchaDetected straight away in unattended mode
+        """
+        if self.unattended:
+            raise CaptchaDetected(f"CAPTCHA detected{context}")
+        logger.warning(f"⚠️ CAPTCHA detected{context}! Please solve it manually in the browser...")
+        logger.warning(f"   The scraper will wait up to {timeout}s for it to be solved.")
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=2).until_not(
+                lambda driver: self._captcha_present()
+            )
+        except TimeoutException:
+            logger.error(f"❌ CAPTCHA was not solved within {timeout}s - skipping this search")
+            self._maps_loaded = False  # start from a fresh page next time
+            return False
+        logger.info("✅ CAPTCHA solved, continuing...")
+        return True
 
     def _clean_phone_text(self, phone_text: str) -> str:
-        if phone_text.startswith("Phone:"):
-            phone_text = phone_text.split("Phone:", 1)[1].strip()
-        if phone_text.startswith("Call:"):
-            phone_text = phone_text.split("Call:", 1)[1].strip()
+        phone_text = PHONE_PREFIX_RE.sub("", phone_text).strip()
         return phone_text or "N/A"
 
     def _get_state_from_address(self, address: str) -> str:
@@ -153,78 +597,42 @@ class GoogleMapsScraper:
         logger.info(f"Searching Google Maps for '{query}' in '{location}'")
         results = []
 
+        self._recycle_browser_if_due()
+
         wait_results = WebDriverWait(self.driver, 20)
         wait_search = WebDriverWait(self.driver, 10)
 
-        # Always start fresh at Google Maps homepage
-        self.driver.get("https://www.google.com/maps")
-        # Random wait to appear more human-like
-        time.sleep(2 + random.uniform(0, 2))
+        # Maps is a single-page app: type the next query into the page that is
+        # already loaded, and only reload it every max_queries_per_page_load
+        # searches to bound browser memory (the search box wait covers page load)
+        self._reset_selector_cache()
+        previous_card = None
+        if self._maps_loaded and self._queries_since_page_load < self.max_queries_per_page_load:
+            previous_cards = self._find_result_cards()
+            if previous_cards:
+                previous_card = previous_cards[0]
+        else:
+            if self._maps_loaded:
+                self.driver.get("about:blank")
+            self._maps_loaded = False
+            self._queries_since_page_load = 0
+            self.driver.get("https://www.google.com/maps")
+        self._queries_since_page_load += 1
 
         # Handle cookie / consent popups if they appear
-        try:
-            consent_button = self.driver.find_element(
-                By.XPATH,
-                "//button[contains(., 'Accept all') or contains(., 'I agree') or contains(., 'Accept')]",
-            )
-            consent_button.click()
-            logger.info("Clicked consent/accept button.")
-            time.sleep(2)
-        except NoSuchElementException:
-            pass
-        
-        # Check for captcha with multiple detection methods
-        captcha_detected = False
-        captcha_indicators = [
-            "//*[contains(text(), 'captcha') or contains(text(), 'CAPTCHA')]",
-            "//iframe[contains(@src, 'recaptcha')]",
-            "//div[contains(@class, 'g-recaptcha')]",
-            "//*[contains(@id, 'recaptcha')]",
-            "//*[contains(@class, 'captcha')]",
-            "//*[contains(text(), 'verify you') or contains(text(), 'verify that')]",
-        ]
-        
-        for indicator in captcha_indicators:
-            try:
-                captcha = self.driver.find_element(By.XPATH, indicator)
-                if captcha and captcha.is_displayed():
-                    captcha_detected = True
-                    break
-            except (NoSuchElementException, Exception):
-                continue
+        self._accept_consent()
         
-        # Also check page source for CAPTCHA-related text
-        if not captcha_detected:
-            try:
-                page_source = self.driver.page_source.lower()
-                if 'recaptcha' in page_source or 'captcha' in page_source:
-                    # Check if it's actually visible
-                    try:
-                        if self.driver.find_element(By.XPATH, "//iframe[contains(@src, 'recaptcha')]"):
-                            captcha_detected = True
-                    except:
-                        pass
-            except:
-                pass
+        # Check for captcha
+        captcha_detected = self._captcha_present()
         
-        if captcha_detected:
-            logger.warning("⚠️ CAPTCHA detected! Please solve it manually in the browser...")
-            logger.warning("   The scraper will wait for you to solve it.")
-            input("   Press Enter in the terminal after solving the CAPTCHA...")
-            time.sleep(3)  # Give it a moment after solving
+        if captcha_detected and not self._wait_captcha_resolved():
+            return results
 
         # Find and use the search box
         try:
             # Try multiple selectors for the search box
             search_box = None
-            search_selectors = [
-                (By.ID, "searchboxinput"),
-                (By.XPATH, "//input[@id='searchboxinput']"),
-                (By.XPATH, "//input[@placeholder*='Search' or @aria-label*='Search']"),
-                (By.CSS_SELECTOR, "input#searchboxinput"),
-            ]
-            
-            for by, selector in search_selectors:
+            for by, selector in SEARCH_BOX_SELECTORS:
                 try:
                     search_box = wait_search.until(EC.presence_of_element_located((by, selector)))
                     break
@@ -233,22 +641,28 @@ class GoogleMapsScraper:
             
             if not search_box:
                 logger.error("Could not find Google Maps search box")
+                self._maps_loaded = False  # reload the page for the next search
                 return results
+            self._maps_loaded = True
 
             # Clear any existing text and enter new search
             search_box.clear()
-            time.sleep(0.5)
             search_query = f"{query} in {location}"
             search_box.send_keys(search_query)
-            time.sleep(1)
+            # Short random pause before submitting, like a person typing
+            time.sleep(random.uniform(0.3, 0.8))
             
-            # Submit search (press Enter)
+            # Submit search (press Enter); _load_initial_results waits for the results
             search_box.send_keys(Keys.ENTER)
-            # Random wait to appear more human-like
-            time.sleep(3 + random.uniform(1, 2))  # Wait 4-5 seconds for results to load
+
+            # On a reused page, wait for the previous query's cards to be
+            # replaced so they are not scraped as this query's results
+            if previous_card is not None:
+                self._wait_for_staleness(previous_card, timeout=10)
             
         except Exception as e:
             logger.error(f"Error using search box: {e}")
+            self._maps_loaded = False
             return results
 
         # Now wait for results to appear - with retry
@@ -261,14 +675,14 @@ class GoogleMapsScraper:
             else:
                 if attempt < max_retries - 1:
                     logger.warning(f"Retry {attempt + 1}/{max_retries}: Could not load results, trying again...")
-                    time.sleep(3)
                     # Try clicking search again
                     try:
-                        search_box = self.driver.find_element(By.ID, "searchboxinput")
+                        search_box = wait_search.until(
+                            EC.element_to_be_clickable((By.ID, "searchboxinput"))
+                        )
                         search_box.clear()
                         search_box.send_keys(f"{query} in {location}")
                         search_box.send_keys(Keys.ENTER)
-                        time.sleep(4)
                     except:
                         pass
         
@@ -280,14 +694,14 @@ class GoogleMapsScraper:
             # Final attempt: completely fresh start
             try:
                 self.driver.get("https://www.google.com/maps")
-                time.sleep(4)
                 
                 # Try search box again
-                search_box = self.driver.find_element(By.ID, "searchboxinput")
+                search_box = wait_search.until(
+                    EC.element_to_be_clickable((By.ID, "searchboxinput"))
+                )
                 search_box.clear()
                 search_box.send_keys(f"{query} in {location}")
                 search_box.send_keys(Keys.ENTER)
-                time.sleep(5)
                 
                 if self._load_initial_results(wait_results):
                     logger.info("✅ Fresh page load worked! Continuing...")
@@ -315,12 +729,12 @@ class GoogleMapsScraper:
                     if consecutive_empty_scrolls >= 5:  # Increased from 3 to 5 for more persistence
                         logger.info(f"Reached end of results after {total_scrolls} scrolls. Found {len(results)}/{max_results} results.")
                         break
-                    time.sleep(2)
+                    self._wait_for_more_cards(0, timeout=2)
                     continue
+                # _scroll_results_panel already waited for new cards
                 consecutive_empty_scrolls = 0
                 pages_without_new += 1
                 total_scrolls += 1
-                time.sleep(1.5 + random.uniform(0, 1))  # Wait for new cards to load with random delay
                 continue
 
             consecutive_empty_scrolls = 0
@@ -357,14 +771,12 @@ class GoogleMapsScraper:
                 else:
                     pages_without_new += 1
                     total_scrolls += 1
-                    time.sleep(1.5 + random.uniform(0, 1))  # Wait for new content with random delay
             else:
                 pages_without_new = 0  # Reset counter when we find new cards
                 # Scroll to load more if we haven't reached max yet
                 if len(results) < max_results:
                     self._scroll_results_panel()
                     total_scrolls += 1
-                    time.sleep(1 + random.uniform(0, 0.5))
 
         logger.info(f"✅ Collected {len(results)}/{max_results} results for '{query}' in '{location}' (after {total_scrolls} scrolls)")
         if len(results) < max_results:
@@ -374,43 +786,37 @@ class GoogleMapsScraper:
     def _load_initial_results(self, wait_results: WebDriverWait) -> bool:
         """Ensure the results list is rendered and scroll a bit to load items."""
         try:
-            # Wait for results container with longer timeout
+            # Wait for the results container - or stop early on a "no results" page
             wait_results.until(
-                EC.presence_of_element_located(
-                    (By.CSS_SELECTOR, "div[role='feed'], div[aria-label*='Results']")
+                EC.any_of(
+                    EC.presence_of_element_located(
+                        (By.CSS_SELECTOR, "div[role='feed'], div[aria-label*='Results']")
+                    ),
+                    EC.presence_of_element_located(
+                        (By.XPATH, "//*[contains(text(), 'No results') or contains(text(), 'no results') or contains(text(), \"didn't match\")]")
+                    ),
                 )
             )
         except TimeoutException:
-            # Check if we're on a "no results" page
-            try:
-                page_text = self.driver.find_element(By.TAG_NAME, "body").text
-                if "no results" in page_text.lower() or "didn't match" in page_text.lower():
-                    logger.warning("Google Maps shows 'No results found' for this search")
-                    return False
-            except:
-                pass
             logger.warning("Results list did not appear in time.")
             return False
 
         list_container = self._get_results_container()
         if not list_container:
-            logger.warning("Could not find results container")
+            # The wait above ended on a "no results" message
+            logger.warning("Google Maps shows 'No results found' for this search")
             return False
 
-        # Wait for initial cards to render
-        time.sleep(2)
-        
-        # Scroll multiple times to force Google Maps to load cards
+        # Wait for initial cards to render; scroll to force Google Maps to
+        # load them if they don't show up on their own
         for i in range(6):  # Increased from 4 to 6 for better initial loading
+            cards = self._wait_for_more_cards(0, timeout=2)
+            if cards:
+                logger.debug(f"Found {len(cards)} cards after scroll {i}")
+                return True
             self.driver.execute_script(
                 "arguments[0].scrollTop = arguments[0].scrollHeight", list_container
             )
-            time.sleep(1.5 + random.uniform(0, 0.5))
-            # Check if we got cards after each scroll
-            cards = self._find_result_cards()
-            if cards:
-                logger.debug(f"Found {len(cards)} cards after scroll {i+1}")
-                return True
         
         # Final check
         cards = self._find_result_cards()
@@ -422,39 +828,50 @@ class GoogleMapsScraper:
             return False
 
     def _get_results_container(self):
-        selectors = [
-            "div[aria-label*='Results'] div[role='feed']",
-            "div[role='feed']",
-            "div.section-layout.section-scrollbox",
-        ]
+        # Try the selector that matched last time before probing the others
+        selectors = RESULTS_CONTAINER_SELECTORS
+        if self._container_selector:
+            selectors = [self._container_selector] + [
+                sel for sel in selectors if sel != self._container_selector
+            ]
         for selector in selectors:
             try:
                 container = self.driver.find_element(By.CSS_SELECTOR, selector)
+                self._container_selector = selector
                 return container
             except Exception:
                 continue
+        self._container_selector = None
         return None
 
     def _find_result_cards(self):
         """Find result cards with multiple fallback selectors."""
-        selectors = [
-            "div[role='article']",
-            "div[class*='Nv2PK']",
-            "div[jsaction*='mouseover:pane']",
-        ]
+        selectors = RESULT_CARD_SELECTORS
+        if self._cards_selector:
+            selectors = [self._cards_selector] + [
+                sel for sel in selectors if sel != self._cards_selector
+            ]
         for selector in selectors:
             cards = self.driver.find_elements(By.CSS_SELECTOR, selector)
             if cards:
+                self._cards_selector = selector
                 return cards
         return []
 
+    def _reset_selector_cache(self):
+        """Forget per-page state: matched selectors (a new page may be a different Maps UI variant) and observer misses"""
+        self._container_selector = None
+        self._cards_selector = None
+        self._observer_misses = 0
+
     def _extract_from_card(self, card_element, query, location):
         """
         Extract as much info as possible from a single result card
         without clicking into the place detail page.
         """
         try:
-            text = card_element.text or ""
+            card = self.driver.execute_script(CARD_EXTRACT_JS, card_element)
+            text = card["text"]
             if not text.strip():
                 return None
 
@@ -467,9 +884,8 @@ class GoogleMapsScraper:
 
             # Address heuristic: line with a number and a street keyword
             address = "N/A"
-            street_keywords = ["St", "Street", "Ave", "Avenue", "Blvd", "Road", "Rd", "Dr", "Lane", "Ln"]
             for ln in lines[1:]:
-                if any(kw in ln for kw in street_keywords) and re.search(r"\d", ln):
+                if ADDRESS_LINE_RE.search(ln):
                     address = ln
                     break
 
@@ -488,78 +904,57 @@ class GoogleMapsScraper:
             phone = "N/A"
             
             # Method 1: Look for tel: links in the card
-            try:
-                tel_links = card_element.find_elements(By.CSS_SELECTOR, "a[href^='tel:']")
-                for tel_link in tel_links:
-                    href = tel_link.get_attribute("href") or ""
-                    if href.startswith("tel:"):
-                        phone = href.replace("tel:", "").strip()
-                        break
-            except Exception:
-                pass
+            for href in card["telHrefs"]:
+                if href.startswith("tel:"):
+                    phone = href.replace("tel:", "").strip()
+                    break
             
             # Method 2: Look for phone buttons with data attributes
             if phone == "N/A":
-                try:
-                    phone_buttons = card_element.find_elements(
-                        By.CSS_SELECTOR, 
-                        "button[data-item-id*='phone'], button[aria-label*='Phone'], button[aria-label*='Call']"
-                    )
-                    for btn in phone_buttons:
-                        aria_label = btn.get_attribute("aria-label") or ""
-                        if "phone" in aria_label.lower() or "call" in aria_label.lower():
-                            # Extract phone from aria-label
-                            phone_match = re.search(r"(\+?\d[\d\-\.\s\(\)]{7,}\d)", aria_label)
-                            if phone_match:
-                                phone = phone_match.group(1).strip()
-                                break
-                        # Or get text directly
-                        btn_text = btn.text.strip()
-                        if btn_text and re.search(r"\d", btn_text):
-                            phone_match = re.search(r"(\+?\d[\d\-\.\s\(\)]{7,}\d)", btn_text)
-                            if phone_match:
-                                phone = phone_match.group(1).strip()
-                                break
-                except Exception:
-                    pass
+                for btn in card["phoneButtons"]:
+                    aria_label = btn["aria"]
+                    if "phone" in aria_label.lower() or "call" in aria_label.lower():
+                        # Extract phone from aria-label
+                        phone_match = PHONE_NUMBER_RE.search(aria_label)
+                        if phone_match:
+                            phone = phone_match.group(1).strip()
+                            break
+                    # Or get text directly
+                    btn_text = btn["text"].strip()
+                    if btn_text and DIGIT_RE.search(btn_text):
+                        phone_match = PHONE_NUMBER_RE.search(btn_text)
+                        if phone_match:
+                            phone = phone_match.group(1).strip()
+                            break
             
             # Method 3: Regex on entire card text (multiple patterns)
             if phone == "N/A":
-                phone_patterns = [
-                    r"(\+?1?[\s\-\.]?\(?\d{3}\)?[\s\-\.]?\d{3}[\s\-\.]?\d{4})",  # US format
-                    r"(\+\d{1,3}[\s\-\.]?\d{1,4}[\s\-\.]?\d{1,4}[\s\-\.]?\d{1,9})",  # International
-                    r"(\(?\d{3}\)?[\s\-\.]?\d{3}[\s\-\.]?\d{4})",  # Simple US
-                    r"(\d{3}[\s\-\.]\d{3}[\s\-\.]\d{4})",  # Dotted/dashed
-                ]
-                for pattern in phone_patterns:
-                    phone_match = re.search(pattern, text)
+                for pattern in PHONE_TEXT_PATTERNS:
+                    phone_match = pattern.search(text)
                     if phone_match:
                         phone = phone_match.group(1).strip()
                         break
             
-            # Method 4: Look in all links and spans for phone-like text
+            # Method 4: Any phone-like card line or aria-label (labels can carry
+            # numbers that are not part of the visible text)
             if phone == "N/A":
-                try:
-                    all_elements = card_element.find_elements(By.CSS_SELECTOR, "a, span, div, button")
-                    for elem in all_elements:
-                        elem_text = elem.text or elem.get_attribute("textContent") or ""
-                        if elem_text and re.search(r"\d{3}.*\d{3}.*\d{4}", elem_text):
-                            phone_match = re.search(r"(\+?\d[\d\-\.\s\(\)]{7,}\d)", elem_text)
-                            if phone_match:
-                                phone = phone_match.group(1).strip()
-                                break
-                except Exception:
-                    pass
+                for candidate in itertools.chain(lines, card["ariaLabels"]):
+                    if not PHONE_LIKE_RE.search(candidate):
+                        continue
+                    phone_match = PHONE_NUMBER_RE.search(candidate)
+                    if phone_match:
+                        phone = phone_match.group(1).strip()
+                        break
             
             phone = self._clean_phone_text(phone)
 
             # Rating: look for something like "4.3" followed by "★" or "stars"
             rating = "N/A"
-            rating_match = re.search(r"(\d\.\d)\s*★", text)
+            rating_match = RATING_STAR_RE.search(text)
             if rating_match:
                 rating = rating_match.group(1)
             else:
-                rating_match = re.search(r"Rated\s+(\d\.\d)\s+out of", text)
+                rating_match = RATING_OUT_OF_RE.search(text)
                 if rating_match:
                     rating = rating_match.group(1)
 
@@ -567,41 +962,25 @@ class GoogleMapsScraper:
             website = "N/A"
             
             # Method 1: Look for website links with specific attributes
-            try:
-                website_links = card_element.find_elements(
-                    By.CSS_SELECTOR,
-                    "a[href^='http'], a[data-item-id='authority'], a[aria-label*='Website'], a[aria-label*='website']"
-                )
-                for link in website_links:
-                    href = link.get_attribute("href") or ""
-                    if href and (href.startswith("http://") or href.startswith("https://")):
-                        # Filter out Google Maps links
-                        if "google.com/maps" not in href and "maps.google.com" not in href:
-                            website = href
-                            break
-            except Exception:
-                pass
+            for href in card["websiteHrefs"]:
+                if href and (href.startswith("http://") or href.startswith("https://")):
+                    # Filter out Google Maps links
+                    if "google.com/maps" not in href and "maps.google.com" not in href:
+                        website = href
+                        break
             
             # Method 2: Look for website in aria-labels
             if website == "N/A":
-                try:
-                    website_buttons = card_element.find_elements(
-                        By.CSS_SELECTOR,
-                        "button[aria-label*='Website'], button[aria-label*='website'], button[data-item-id*='authority']"
-                    )
-                    for btn in website_buttons:
-                        aria_label = btn.get_attribute("aria-label") or ""
-                        # Sometimes website URL is in aria-label
-                        url_match = re.search(r"(https?://[^\s]+)", aria_label)
-                        if url_match:
-                            website = url_match.group(1)
-                            break
-                except Exception:
-                    pass
+                for aria_label in card["websiteAriaLabels"]:
+                    # Sometimes website URL is in aria-label
+                    url_match = URL_RE.search(aria_label)
+                    if url_match:
+                        website = url_match.group(1)
+                        break
             
             # Method 3: Extract from text if it looks like a URL
             if website == "N/A":
-                url_match = re.search(r"(https?://[^\s\n]+)", text)
+                url_match = URL_RE.search(text)
                 if url_match:
                     potential_url = url_match.group(1)
                     if "google.com/maps" not in potential_url and "maps.google.com" not in potential_url:
@@ -626,20 +1005,23 @@ class GoogleMapsScraper:
         if not container:
             return False
         try:
-            # Get current scroll position
-            current_scroll = self.driver.execute_script(
-                "return arguments[0].scrollTop", container
-            )
-            scroll_height = self.driver.execute_script(
-                "return arguments[0].scrollHeight", container
-            )
-            
-            # Scroll down - use smooth scrolling to appear more human-like
-            self.driver.execute_script(
-                "arguments[0].scrollTop = arguments[0].scrollHeight", container
-            )
-            # Random delay to mimic human behavior
-            time.sleep(1.5 + random.uniform(0, 1))  # Wait for new content to load
+            # One call records the scroll position, (re)arms the feed's
+            # MutationObserver and scrolls to the bottom
+            current_scroll = self.driver.execute_script(SCROLL_FEED_JS, container)
+
+            # Wait until Google Maps renders more of the list (or give up after a few seconds).
+            # If the observer keeps missing, fall back to counting cards.
+            if self._observer_misses < 3:
+                try:
+                    WebDriverWait(self.driver, 3, poll_frequency=0.25).until(
+                        lambda driver: driver.execute_script(FEED_NODES_ADDED_JS, container)
+                    )
+                    self._observer_misses = 0
+                except TimeoutException:
+                    self._observer_misses += 1
+            else:
+                # Cards can already be there by now; this only waits for more
+                self._wait_for_more_cards(len(self._find_result_cards()), timeout=3)
             
             # Check if we actually scrolled
             new_scroll = self.driver.execute_script(
@@ -657,18 +1039,31 @@ class GoogleMapsScraper:
             return False
 
     def _card_identifier(self, card_element):
-        candidates = [
-            card_element.get_attribute("data-result-id"),
-            card_element.get_attribute("aria-label"),
-            card_element.text.split("\n")[0] if card_element.text else "",
-        ]
-        for candidate in candidates:
-            if candidate:
-                return candidate.strip()
+        try:
+            identifier = self.driver.execute_script(CARD_IDENTIFIER_JS, card_element)
+        except StaleElementReferenceException:
+            identifier = None
+        if identifier and identifier.strip():
+            return identifier.strip()
         return str(id(card_element))
 
     # ---------- second pass: enrich missing phones by clicking ----------
 
+    def _close_detail_panel(self, wait_results: WebDriverWait):
+        """
+        Dismiss the place detail pane and wait for the results list.
+        Falls back to browser history if there is no close button.
+        """
+        try:
+            self.driver.find_element(By.CSS_SELECTOR, DETAIL_CLOSE_BUTTON_SELECTOR).click()
+        except (NoSuchElementException, StaleElementReferenceException):
+            self.driver.back()
+        wait_results.until(
+            EC.presence_of_element_located(
+                (By.CSS_SELECTOR, "div[role='feed'], div[aria-label*='Results']")
+            )
+        )
+
     def enrich_missing_phones(self, leads, query, location, max_clicks: int = 20):
         """
         Second pass:
@@ -676,9 +1071,11 @@ class GoogleMapsScraper:
         - For leads that are missing phone numbers OR websites, click into matching cards
           and try to pull phone/website from the detail panel using comprehensive selectors.
         """
-        missing_phone = [lead for lead in leads if not lead.get("phone") or lead["phone"] == "N/A"]
-        missing_website = [lead for lead in leads if not lead.get("website") or lead["website"] == "N/A"]
-        missing = list(set(missing_phone + missing_website))  # Unique leads that need enrichment
+        # Leads that need enrichment (missing a phone, a website, or both)
+        missing = [
+            lead for lead in leads
+            if lead.get("phone", "N/A") in ("", "N/A") or lead.get("website", "N/A") in ("", "N/A")
+        ]
         
         if not missing or max_clicks <= 0:
             return leads
@@ -690,49 +1087,21 @@ class GoogleMapsScraper:
 
         name_to_lead = {lead.get("name"): lead for lead in missing if lead.get("name")}
 
-        wait_results = WebDriverWait(self.driver, 20)
-        wait_details = WebDriverWait(self.driver, 20)
+        wait_results = WebDriverWait(self.driver, 20, poll_frequency=DETAIL_POLL_SECONDS)
+        wait_details = WebDriverWait(self.driver, 20, poll_frequency=DETAIL_POLL_SECONDS)
 
-        search_url = (
-            "https://www.google.com/maps/search/"
-            f"{query.replace(' ', '+')}+{location.replace(' ', '+')}"
-        )
+        search_url = f"https://www.google.com/maps/search/{quote_plus(f'{query} {location}')}"
+        self._reset_selector_cache()
         self.driver.get(search_url)
 
         # Handle cookie / consent popups if they appear
-        time.sleep(2 + random.uniform(0, 1))
-        try:
-            consent_button = self.driver.find_element(
-                By.XPATH,
-                "//button[contains(., 'Accept all') or contains(., 'I agree') or contains(., 'Accept')]",
-            )
-            consent_button.click()
-            logger.info("Clicked consent/accept button (enrich pass).")
-            time.sleep(2)
-        except NoSuchElementException:
-            pass
+        self._accept_consent(" (enrich pass)")
         
         # Check for CAPTCHA in enrichment pass too
-        captcha_detected = False
-        captcha_indicators = [
-            "//iframe[contains(@src, 'recaptcha')]",
-            "//div[contains(@class, 'g-recaptcha')]",
-            "//*[contains(@id, 'recaptcha')]",
-            "//*[contains(text(), 'captcha') or contains(text(), 'CAPTCHA')]",
-        ]
-        for indicator in captcha_indicators:
-            try:
-                captcha = self.driver.find_element(By.XPATH, indicator)
-                if captcha and captcha.is_displayed():
-                    captcha_detected = True
-                    break
-            except:
-                continue
+        captcha_detected = self._captcha_present()
         
-        if captcha_detected:
-            logger.warning("⚠️ CAPTCHA detected in enrichment pass! Please solve it...")
-            input("Press Enter after solving the CAPTCHA...")
-            time.sleep(3)
+        if captcha_detected and not self._wait_captcha_resolved(" in enrichment pass"):
+            return leads
 
         if not self._load_initial_results(wait_results):
             logger.warning("Enrich pass: could not load results list.")
@@ -751,22 +1120,38 @@ class GoogleMapsScraper:
 
             new_clicks_this_page = 0
 
-            for card in cards:
-                # Identify card's business name from its text
-                card_text = card.text or ""
-                lines = [ln.strip() for ln in card_text.split("\n") if ln.strip()]
-                if not lines:
+            # Identify every card's business name (first text line) in one call
+            try:
+                card_names = self.driver.execute_script(CARD_NAMES_JS, cards)
+            except StaleElementReferenceException:
+                # The list re-rendered under us; look the cards up again
+                pages_without_new += 1
+                continue
+
+            for card, card_name in zip(cards, card_names):
+                if not card_name:
                     continue
 
-                card_name = lines[0]
                 lead = name_to_lead.get(card_name)
                 if not lead:
                     continue
 
+                # Only open the card if it still has something to fill in
+                wanted = {}
+                if lead.get("phone", "N/A") in ("", "N/A"):
+                    wanted["phone"] = DETAIL_PHONE_CANDIDATES
+                if lead.get("website", "N/A") in ("", "N/A"):
+                    wanted["website"] = DETAIL_WEBSITE_CANDIDATES
+                if not wanted:
+                    name_to_lead.pop(card_name, None)
+                    continue
+
                 # Click into detail
                 try:
                     self.driver.execute_script("arguments[0].scrollIntoView(true);", card)
-                    time.sleep(0.5 + random.uniform(0, 0.5))  # Random 0.5-1 second
+                    WebDriverWait(self.driver, 2, poll_frequency=DETAIL_POLL_SECONDS).until(
+                        EC.element_to_be_clickable(card)
+                    )
                     card.click()
                 except Exception as e:
                     logger.debug(f"Enrich pass: could not click card '{card_name}': {e}")
@@ -776,110 +1161,56 @@ class GoogleMapsScraper:
                 try:
                     wait_details.until(
                         EC.presence_of_element_located(
-                            (By.XPATH, "//h1[contains(@class,'DUwDvf') or contains(@class,'fontHeadlineLarge')]")
+                            (By.CSS_SELECTOR, "h1[class*='DUwDvf'], h1[class*='fontHeadlineLarge']")
                         )
                     )
-                    time.sleep(1)
                 except TimeoutException:
                     logger.debug(f"Enrich pass: timeout waiting for details of '{card_name}'")
-                    # try going back
+                    # try going back to the list
                     try:
-                        self.driver.back()
-                        time.sleep(2)
-                        wait_results.until(
-                            EC.presence_of_element_located(
-                                (By.CSS_SELECTOR, "div[role='feed'], div[aria-label*='Results']")
-                            )
-                        )
+                        self._close_detail_panel(wait_results)
                     except Exception:
                         pass
                     continue
 
-                # Try to get phone from detail panel with comprehensive selectors
-                phone_detail = self._wait_and_get_text(
-                    [
-                        (By.XPATH, "//button[contains(@aria-label,'Phone:')]", "aria-label"),
-                        (By.XPATH, "//button[contains(@aria-label,'Call:')]", "aria-label"),
-                        (By.XPATH, "//button[contains(@data-item-id,'phone:tel')]//div[contains(@class,'fontBodyMedium')]", None),
-                        (By.XPATH, "//button[contains(@data-item-id,'phone:tel')]", None),
-                        (By.XPATH, "//a[starts-with(@href,'tel:')]", "href"),
-                        (By.XPATH, "//button[contains(@data-value,'Phone')]", None),
-                        (By.XPATH, "//div[contains(@data-value,'Phone')]", None),
-                        (By.XPATH, "//span[contains(@class,'phone')]", None),
-                        (By.XPATH, "//div[contains(@class,'phone')]", None),
-                        (By.CSS_SELECTOR, "button[data-item-id*='phone']", None),
-                        (By.CSS_SELECTOR, "a[href^='tel:']", "href"),
-                        (By.XPATH, "//*[contains(text(),'Phone') or contains(text(),'Call')]/following-sibling::*[1]", None),
-                        # Additional fallbacks
-                        (By.XPATH, "//button[contains(@jsaction,'phone')]", None),
-                        (By.XPATH, "//div[contains(@jsaction,'phone')]", None),
-                    ],
-                    timeout=6,  # Reduced timeout for speed
-                )
-                if phone_detail.startswith("tel:"):
-                    phone_detail = phone_detail.replace("tel:", "")
-                if phone_detail.startswith("Phone:"):
-                    phone_detail = phone_detail.split("Phone:", 1)[1].strip()
-                if phone_detail.startswith("Call:"):
-                    phone_detail = phone_detail.split("Call:", 1)[1].strip()
-                phone_detail = self._clean_phone_text(phone_detail)
-
-                # Try to get website from detail panel with comprehensive selectors
-                website_detail = self._wait_and_get_text(
-                    [
-                        (By.XPATH, "//a[contains(@aria-label,'Website')]", "href"),
-                        (By.XPATH, "//a[contains(@data-item-id,'authority')]", "href"),
-                        (By.XPATH, "//a[contains(@href,'http') and not(contains(@href,'google.com/maps'))]", "href"),
-                        (By.XPATH, "//button[contains(@aria-label,'Website')]", "aria-label"),
-                        (By.XPATH, "//button[contains(@data-item-id,'authority')]", None),
-                        (By.CSS_SELECTOR, "a[data-item-id='authority']", "href"),
-                        (By.CSS_SELECTOR, "a[href^='http']:not([href*='google.com/maps'])", "href"),
-                        (By.XPATH, "//*[contains(text(),'Website')]/following-sibling::a[1]", "href"),
-                        (By.XPATH, "//*[contains(@class,'website')]//a", "href"),
-                    ],
+                # Try to get the missing phone/website from the detail panel with
+                # comprehensive selectors (probed together in the page)
+                details = self._wait_and_get_texts(
+                    wanted,
                     timeout=6,  # Reduced timeout for speed
                 )
+                phone_detail = self._clean_phone_text(details.get("phone", "N/A"))
+                website_detail = details.get("website", "N/A")
+
                 if website_detail and "google.com/maps" in website_detail:
                     website_detail = "N/A"
                 if website_detail and not (website_detail.startswith("http://") or website_detail.startswith("https://")):
                     # Might be in aria-label, try to extract URL
-                    url_match = re.search(r"(https?://[^\s]+)", website_detail)
+                    url_match = URL_RE.search(website_detail)
                     if url_match:
                         website_detail = url_match.group(1)
                     else:
                         website_detail = "N/A"
 
                 # Update lead if we found phone or website
-                updated = False
                 if phone_detail != "N/A" and (not lead.get("phone") or lead["phone"] == "N/A"):
                     lead["phone"] = phone_detail
                     logger.info(f"Enrich pass: found phone {phone_detail} for '{card_name}'")
-                    updated = True
                 
                 if website_detail != "N/A" and (not lead.get("website") or lead["website"] == "N/A"):
                     lead["website"] = website_detail
                     logger.info(f"Enrich pass: found website {website_detail} for '{card_name}'")
-                    updated = True
                 
-                # Remove from pending if both phone and website are now filled
-                if updated and lead.get("phone") != "N/A" and lead.get("website") != "N/A":
-                    name_to_lead.pop(card_name, None)
-                elif updated and (lead.get("phone") != "N/A" or lead.get("website") != "N/A"):
-                    # Still keep in pending if only one was filled
-                    pass
+                # This card's details have been read; opening it again on a
+                # later page would only repeat the same lookup
+                name_to_lead.pop(card_name, None)
 
                 clicks_done += 1
                 new_clicks_this_page += 1
 
-                # Go back to results (with random delay to appear human-like)
+                # Close the detail pane; the results list stays loaded underneath
                 try:
-                    self.driver.back()
-                    time.sleep(1 + random.uniform(0.5, 1.5))  # Random 1.5-2.5 seconds
-                    wait_results.until(
-                        EC.presence_of_element_located(
-                            (By.CSS_SELECTOR, "div[role='feed'], div[aria-label*='Results']")
-                        )
-                    )
+                    self._close_detail_panel(wait_results)
                 except Exception:
                     logger.debug("Enrich pass: error going back to results, stopping.")
                     return leads
@@ -897,3 +1228,86 @@ class GoogleMapsScraper:
 
         logger.info(f"Enrich pass complete. Clicks used: {clicks_done}")
         return leads
+
+
+class GoogleMapsScraperPool:
+    """
+    A fixed set of GoogleMapsScraper instances (one Chrome each) that run
+    searches concurrently. A search spends nearly all of its time waiting on
+    the browser, and Selenium releases the GIL while it does, so threads are
+    enough to keep several browsers busy at once.
+    """
+
+    def __init__(self, size: int = 4, headless: bool = True, **scraper_kwargs):
+        """
+        Args:
+            size: Number of browsers
+            headless: Run Chrome without a window
+            scraper_kwargs: Passed on to every GoogleMapsScraper
+        """
+        self.size = max(1, size)
+        self.headless = headless
+        self.scrapers = []
+        self.pool = queue.Queue()
+        try:
+            # Launched one at a time so the webdriver-manager install is not raced
+            for _ in range(self.size):
+                scraper = GoogleMapsScraper(headless=headless, **scraper_kwargs)
+                self.scrapers.append(scraper)
+                self.pool.put(scraper)
+        except Exception:
+            self.close()
+            raise
+        logger.info(f"Started a pool of {self.size} Chrome drivers.")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def start(self):
+        """Relaunch the browser of any scraper that has been closed"""
+        for scraper in self.scrapers:
+            if scraper.driver is None:
+                scraper.setup_driver()
+
+    def close(self):
+        for scraper in self.scrapers:
+            scraper.close()
+
+    def _run(self, func, job):
+        scraper = self.pool.get()
+        try:
+            return func(scraper, *job)
+        finally:
+            self.pool.put(scraper)
+
+    def run_many(self, func, jobs):
+        """
+        Call func(scraper, *job) for every job, each on whichever scraper is free.
+
+        Yields one Future per job, in job order, so the caller can handle a
+        failed job without losing the others. At most 2 * size jobs are
+        submitted ahead of the one being yielded, so finished results are
+        only held until the caller gets to them.
+        """
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            pending = deque()
+            for job in jobs:
+                if len(pending) >= 2 * self.size:
+                    yield pending.popleft()
+                pending.append(executor.submit(self._run, func, job))
+            while pending:
+                yield pending.popleft()
+
+    def search_many(self, jobs):
+        """
+        Run search_businesses for each (query, location, max_results) job.
+
+        Returns: list of result lists, in job order
+        """
+        def search(scraper, query, location, max_results=50):
+            return scraper.search_businesses(query, location, max_results)
+
+        return [future.result() for future in self.run_many(search, jobs)]
@@ -3,15 +3,21 @@ Google Sheets Manager
 Handles saving leads to Google Sheets
 
 FIXES APPLIED:
-- Batch insert instead of single row appends (avoids rate limiting)
+- Batch insert instead of single row appends (one append request per run)
 - Efficient duplicate checking (load sheet once, not per lead)
 - Better retry logic with exponential backoff
 - Proper error handling and logging
 """
 
+import itertools
 import gspread
+from gspread.utils import a1_to_rowcol
+from google.auth.exceptions import TransportError
 from google.oauth2.service_account import Credentials
+import requests
+from requests.adapters import HTTPAdapter
 import logging
+import random
 import time
 from datetime import datetime
 
@@ -21,7 +27,45 @@ logger = logging.getLogger(__name__)
 # Google Sheets API limits
 MAX_RETRIES = 5
 BASE_RETRY_DELAY = 2  # seconds
-BATCH_SIZE = 50  # rows per batch insert
+MAX_RETRY_DELAY = 32  # seconds, before jitter
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+# Network failures worth retrying (the request never got a response)
+TRANSIENT_ERRORS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout, TransportError)
+# The subset that is also safe for appends: the request never reached the
+# server, so resending it can't add the rows twice
+UNSENT_ERRORS = (requests.exceptions.ConnectTimeout,)
+BATCH_SIZE = 5000  # rows per append request (a normal daily run fits in one call)
+HTTP_POOL_SIZE = 10  # keep-alive connections to the Sheets API
+# With more separate runs of unsent rows than this, get_leads_without_sms
+# reads the whole sheet instead of sending one huge batch_get
+MAX_BATCH_GET_RANGES = 50
+
+# Deletes every non-digit Latin-1 character in one C-level str.translate pass
+NON_DIGIT_TABLE = str.maketrans("", "", "".join(chr(i) for i in range(256) if not chr(i).isdigit()))
+
+
+def normalize_phone(phone):
+    """Digits of a phone number, used as its duplicate-check key"""
+    digits = phone.translate(NON_DIGIT_TABLE)
+    if digits.isdigit() or not digits:
+        return digits
+    # Other characters outside Latin-1 (e.g. the direction marks Maps wraps numbers in)
+    return "".join(filter(str.isdigit, digits))
+
+
+def phone_key(phone):
+    """Key that matches a sheet phone with its E.164 form (US numbers lose the leading 1)"""
+    digits = normalize_phone(phone)
+    if len(digits) == 11 and digits.startswith("1"):
+        return digits[1:]
+    return digits
+
+
+def name_address_key(name, address):
+    """Case-folded (name, address) duplicate-check key, or None without a usable address"""
+    if not name or not address or address == "N/A":
+        return None
+    return (name.casefold(), address.casefold())
 
 
 class GoogleSheetsManager:
@@ -39,6 +83,13 @@ class GoogleSheetsManager:
         self.sheet_name = sheet_name
         self.client = None
         self.sheet = None
+        # (existing_phones, existing_name_address) from the sheet, kept in
+        # step with our own appends so the sheet is only read once
+        self._dedup_cache = None
+        # phone key -> sheet row number, for SMS status updates
+        self._phone_to_row = None
+        # Full get_all_values() result, dropped whenever we write to the sheet
+        self._values_cache = None
         self.connect()
 
     def connect(self):
@@ -52,6 +103,7 @@ class GoogleSheetsManager:
                 self.credentials_file, scopes=scope
             )
             self.client = gspread.authorize(creds)
+            self._tune_http_session()
             spreadsheet = self.client.open_by_key(self.sheet_id)
 
             # Get or create worksheet
@@ -82,8 +134,13 @@ class GoogleSheetsManager:
             current_header = self.sheet.row_values(1)
             if current_header != expected_header:
                 logger.info("Resetting header row in Google Sheet.")
-                self.sheet.clear()
-                self.sheet.append_row(expected_header)
+                # Rewrite row 1 only; the leads below it are kept
+                self.sheet.update(
+                    range_name="A1:M1",
+                    values=[expected_header],
+                    value_input_option="RAW",
+                )
+                self._values_cache = None
 
             logger.info(f"Connected to Google Sheet: {self.sheet_name}")
 
@@ -91,35 +148,69 @@ class GoogleSheetsManager:
             logger.error(f"Error connecting to Google Sheets: {e}")
             raise
 
-    def _retry_with_backoff(self, func, *args, **kwargs):
-        """Execute function with exponential backoff retry logic"""
+    def clear_caches(self):
+        """
+        Forget everything read from the sheet, so the next call reads it again.
+        Needed when one manager is reused across runs: the sheet may have been
+        edited by hand in between, and a stale phone->row index would write
+        SMS statuses to the wrong rows.
+        """
+        self._dedup_cache = None
+        self._phone_to_row = None
+        self._values_cache = None
+
+    def _tune_http_session(self):
+        """Reuse up to HTTP_POOL_SIZE TLS connections instead of requests' default pool"""
+        # gspread 6 keeps the session on client.http_client, gspread 5 on the client
+        session = getattr(getattr(self.client, "http_client", self.client), "session", None)
+        if session is None:
+            return
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_SIZE)
+        session.mount("https://", adapter)
+
+    def _retry_with_backoff(self, func, *args, idempotent=True, **kwargs):
+        """
+        Execute function with exponential backoff retry logic.
+        Only quota/server errors and dropped connections are retried; anything
+        else (bad request, no permission, ...) is raised straight away.
+        Pass idempotent=False for appends: a timeout or dropped connection may
+        come after the server applied the request, so those are not retried.
+        """
+        retryable_errors = TRANSIENT_ERRORS if idempotent else UNSENT_ERRORS
         for attempt in range(MAX_RETRIES):
+            last_attempt = attempt == MAX_RETRIES - 1
             try:
                 return func(*args, **kwargs)
             except gspread.exceptions.APIError as e:
-                if e.response.status_code == 429:  # Rate limited
-                    delay = BASE_RETRY_DELAY * (2 ** attempt)
-                    logger.warning(f"Rate limited. Waiting {delay}s before retry {attempt + 1}/{MAX_RETRIES}")
-                    time.sleep(delay)
-                elif attempt < MAX_RETRIES - 1:
-                    delay = BASE_RETRY_DELAY * (2 ** attempt)
-                    logger.warning(f"API error: {e}. Retrying in {delay}s...")
-                    time.sleep(delay)
-                else:
+                status = e.response.status_code
+                if status not in RETRYABLE_STATUS_CODES or last_attempt:
                     raise
-            except Exception as e:
-                if attempt < MAX_RETRIES - 1:
-                    delay = BASE_RETRY_DELAY * (2 ** attempt)
-                    logger.warning(f"Error: {e}. Retrying in {delay}s...")
-                    time.sleep(delay)
-                else:
+                reason = "Rate limited" if status == 429 else f"API error {status}"
+            except retryable_errors as e:
+                if last_attempt:
                     raise
-        return None
+                reason = f"Connection error ({e})"
+            # Jitter keeps parallel callers from retrying in lockstep
+            delay = min(BASE_RETRY_DELAY * (2 ** attempt), MAX_RETRY_DELAY) + random.uniform(0, 1)
+            logger.warning(f"{reason}. Waiting {delay:.1f}s before retry {attempt + 1}/{MAX_RETRIES}")
+            time.sleep(delay)
+
+    def _get_all_values(self):
+        """Every cell of the sheet, read once and reused until we change the sheet"""
+        if self._values_cache is None:
+            self._values_cache = self._retry_with_backoff(self.sheet.get_all_values) or []
+        return self._values_cache
 
     def _load_existing_data(self):
         """Load existing sheet data once for efficient duplicate checking"""
+        if self._dedup_cache is not None:
+            return self._dedup_cache
         try:
-            all_values = self._retry_with_backoff(self.sheet.get_all_values)
+            # Only the dedup columns (B: Name, C: Address, D: State, E: Phone),
+            # unformatted so the API skips number/date formatting
+            all_values = self._retry_with_backoff(
+                self.sheet.get, "B:E", value_render_option="UNFORMATTED_VALUE"
+            )
             if not all_values:
                 return set(), set()
 
@@ -127,24 +218,23 @@ class GoogleSheetsManager:
             existing_name_address = set()
 
             for row in all_values[1:]:  # Skip header
-                if len(row) < 5:
-                    continue
-
-                name = (row[1] if len(row) > 1 else "").strip()
-                address = (row[2] if len(row) > 2 else "").strip()
-                phone = (row[4] if len(row) > 4 else "").strip()
+                # The API trims trailing empty cells (e.g. a blank Phone), and
+                # unformatted numbers (phones typed as digits) arrive as ints
+                name, address, _, phone = (str(value).strip() for value in (list(row) + [""] * 4)[:4])
 
                 # Normalize phone for comparison
                 if phone and phone != "N/A":
-                    normalized_phone = ''.join(filter(str.isdigit, phone))
+                    normalized_phone = normalize_phone(phone)
                     if normalized_phone:
                         existing_phones.add(normalized_phone)
 
                 # Name+address combo
-                if name and address and address != "N/A":
-                    existing_name_address.add(f"{name.lower()}|{address.lower()}")
+                combo = name_address_key(name, address)
+                if combo:
+                    existing_name_address.add(combo)
 
-            return existing_phones, existing_name_address
+            self._dedup_cache = (existing_phones, existing_name_address)
+            return self._dedup_cache
         except Exception as e:
             logger.error(f"Error loading existing data: {e}")
             return set(), set()
@@ -163,9 +253,16 @@ class GoogleSheetsManager:
         existing_phones, existing_name_address = self._load_existing_data()
         logger.info(f"Found {len(existing_phones)} existing phones, {len(existing_name_address)} name+address combos")
 
-        # Filter and prepare rows
+        # Keys from this batch; merged into the cache once they are saved
+        new_phones = set()
+        new_name_address = set()
+
+        # Filter and prepare rows (all rows of a batch share one "Date Added"
+        # and the same SMS Sent / SMS Date / Notes cells)
         rows_to_add = []
         skipped = 0
+        date_added = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        sms_columns = ("Yes" if sms_sent else "No", sms_date if sms_date else "", notes)
 
         for lead in leads:
             name = lead.get("name", "").strip()
@@ -179,32 +276,37 @@ class GoogleSheetsManager:
             # Check duplicates
             is_duplicate = False
 
+            normalized_phone = ""
+            combo = None
+
             # Check phone
             if phone and phone != "N/A":
-                normalized_phone = ''.join(filter(str.isdigit, phone))
-                if normalized_phone and normalized_phone in existing_phones:
+                normalized_phone = normalize_phone(phone)
+                if normalized_phone and (normalized_phone in existing_phones or normalized_phone in new_phones):
                     logger.debug(f"Duplicate (phone): {name}")
                     skipped += 1
                     is_duplicate = True
-                else:
-                    existing_phones.add(normalized_phone)  # Add to set to catch dupes within batch
 
             # Check name+address
-            if not is_duplicate and name and address and address != "N/A":
-                combo = f"{name.lower()}|{address.lower()}"
-                if combo in existing_name_address:
+            if not is_duplicate:
+                combo = name_address_key(name, address)
+                if combo and (combo in existing_name_address or combo in new_name_address):
                     logger.debug(f"Duplicate (name+address): {name}")
                     skipped += 1
                     is_duplicate = True
-                else:
-                    existing_name_address.add(combo)
 
             if is_duplicate:
                 continue
 
+            # Remember this lead's keys to catch dupes within the batch
+            if normalized_phone:
+                new_phones.add(normalized_phone)
+            if combo:
+                new_name_address.add(combo)
+
             # Prepare row
             row = [
-                datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                date_added,
                 name,
                 address if address else "N/A",
                 lead.get("state", "N/A"),
@@ -214,9 +316,7 @@ class GoogleSheetsManager:
                 lead.get("search_location", "N/A"),
                 lead.get("search_category", "N/A"),
                 lead.get("rating", "N/A"),
-                "Yes" if sms_sent else "No",
-                sms_date if sms_date else "",
-                notes,
+                *sms_columns,
             ]
             rows_to_add.append(row)
 
@@ -236,23 +336,34 @@ class GoogleSheetsManager:
             logger.info(f"Inserting batch {batch_num}/{total_batches} ({len(batch)} rows)...")
 
             try:
-                # Use append_rows for batch insert (much more efficient)
-                self._retry_with_backoff(
+                # Use append_rows for batch insert (much more efficient).
+                # INSERT_ROWS grows the grid instead of overwriting blank rows.
+                response = self._retry_with_backoff(
                     self.sheet.append_rows,
                     batch,
-                    value_input_option='USER_ENTERED'
+                    value_input_option='USER_ENTERED',
+                    insert_data_option='INSERT_ROWS',
+                    idempotent=False,
                 )
+                self._index_appended_rows(response, batch)
                 added += len(batch)
                 logger.info(f"✅ Batch {batch_num} inserted successfully")
 
-                # Small delay between batches to be safe
-                if i + BATCH_SIZE < len(rows_to_add):
-                    time.sleep(1)
-
             except Exception as e:
                 logger.error(f"❌ Failed to insert batch {batch_num}: {e}")
                 failed += len(batch)
 
+        # New rows are not in the values cache yet; re-read it on next use
+        self._values_cache = None
+
+        if failed:
+            # We no longer know exactly what is in the sheet; re-read it next time
+            self._dedup_cache = None
+            self._phone_to_row = None
+        elif self._dedup_cache is not None:
+            self._dedup_cache[0].update(new_phones)
+            self._dedup_cache[1].update(new_name_address)
+
         logger.info(f"Batch insert complete: {added} added, {skipped} skipped, {failed} failed")
         return added, skipped, failed
 
@@ -278,17 +389,15 @@ class GoogleSheetsManager:
             address = business_info.get("address", "").strip()
 
             # Check duplicates
-            if phone and phone != "N/A":
-                normalized_phone = ''.join(filter(str.isdigit, phone))
-                if normalized_phone in existing_phones:
-                    logger.debug(f"Lead already exists (phone): {name}")
-                    return False
+            normalized_phone = normalize_phone(phone) if phone and phone != "N/A" else ""
+            if normalized_phone in existing_phones:
+                logger.debug(f"Lead already exists (phone): {name}")
+                return False
 
-            if name and address and address != "N/A":
-                combo = f"{name.lower()}|{address.lower()}"
-                if combo in existing_name_address:
-                    logger.debug(f"Lead already exists (name+address): {name}")
-                    return False
+            combo = name_address_key(name, address)
+            if combo in existing_name_address:
+                logger.debug(f"Lead already exists (name+address): {name}")
+                return False
 
             # Prepare row data
             row = [
@@ -308,7 +417,13 @@ class GoogleSheetsManager:
             ]
 
             # Append with retry
-            self._retry_with_backoff(self.sheet.append_row, row)
+            response = self._retry_with_backoff(self.sheet.append_row, row, idempotent=False)
+            self._index_appended_rows(response, [row])
+            self._values_cache = None
+            if normalized_phone:
+                existing_phones.add(normalized_phone)
+            if combo:
+                existing_name_address.add(combo)
             logger.info(f"✅ Added lead: {name} | {phone if phone != 'N/A' else 'No phone'}")
             return True
 
@@ -318,28 +433,65 @@ class GoogleSheetsManager:
             logger.debug(traceback.format_exc())
             return False
 
+    def _index_appended_rows(self, response, rows):
+        """Add just-appended rows to the phone->row index, using the range the API reports"""
+        if self._phone_to_row is None:
+            return  # not built yet; it will be read from the sheet on first use
+        try:
+            updated_range = response["updates"]["updatedRange"]  # e.g. "Leads3!A120:M131"
+            first_row, _ = a1_to_rowcol(updated_range.rsplit("!", 1)[-1].split(":")[0])
+        except Exception:
+            # Can't tell where the rows landed; rebuild the index on next use
+            self._phone_to_row = None
+            return
+        for offset, row in enumerate(rows):
+            key = phone_key(row[4])  # column 5 (E): Phone
+            if key:
+                self._phone_to_row.setdefault(key, first_row + offset)
+
+    def _ensure_phone_index(self):
+        """Map each phone in the sheet to its (first) row number, reading the sheet once"""
+        if self._phone_to_row is None:
+            # Column indices (1-based):
+            # 1: Date Added, 2: Name, 3: Address, 4: State, 5: Phone
+            PHONE_COL = 5
+            if self._values_cache is not None:
+                phones = [row[PHONE_COL - 1] if len(row) >= PHONE_COL else "" for row in self._values_cache]
+            else:
+                # Only the phone column is needed
+                phones = self._retry_with_backoff(self.sheet.col_values, PHONE_COL) or []
+            phone_to_row = {}
+            for i, phone in enumerate(phones[1:], start=2):  # row 2 onwards
+                key = phone_key(phone or "")
+                if key:
+                    phone_to_row.setdefault(key, i)
+            self._phone_to_row = phone_to_row
+        return self._phone_to_row
+
+    @staticmethod
+    def _sms_status_ranges(row, sms_sent, sms_date, notes):
+        """batch_update ranges for one row's SMS columns (empty date/notes are left as they are)"""
+        # 11 (K): SMS Sent, 12 (L): SMS Date, 13 (M): Notes
+        ranges = [{"range": f"K{row}", "values": [["Yes" if sms_sent else "No"]]}]
+        if sms_date:
+            ranges.append({"range": f"L{row}", "values": [[sms_date]]})
+        if notes:
+            ranges.append({"range": f"M{row}", "values": [[notes]]})
+        return ranges
+
     def update_lead_sms_status(self, phone, sms_sent=True, sms_date=None, notes=""):
         """
         Update SMS status for a lead based on phone number
         """
         try:
-            all_values = self.sheet.get_all_values()
-            # Column indices (1-based):
-            # 1: Date Added, 2: Name, 3: Address, 4: State, 5: Phone
-            PHONE_COL = 5
-            SMS_SENT_COL = 11
-            SMS_DATE_COL = 12
-            NOTES_COL = 13
-
-            for i, row in enumerate(all_values[1:], start=2):  # row 2 onwards
-                if len(row) >= PHONE_COL and row[PHONE_COL - 1] == phone:
-                    self.sheet.update_cell(i, SMS_SENT_COL, "Yes" if sms_sent else "No")
-                    if sms_date:
-                        self.sheet.update_cell(i, SMS_DATE_COL, sms_date)
-                    if notes:
-                        self.sheet.update_cell(i, NOTES_COL, notes)
-                    logger.info(f"Updated SMS status for: {phone}")
-                    return True
+            i = self._ensure_phone_index().get(phone_key(phone))
+            if i:
+                # All changed cells in one request
+                updates = self._sms_status_ranges(i, sms_sent, sms_date, notes)
+                self._retry_with_backoff(self.sheet.batch_update, updates)
+                self._values_cache = None
+                logger.info(f"Updated SMS status for: {phone}")
+                return True
 
             logger.warning(f"Lead not found with phone: {phone}")
             return False
@@ -348,33 +500,104 @@ class GoogleSheetsManager:
             logger.error(f"Error updating SMS status: {e}")
             return False
 
+    def update_lead_sms_status_bulk(self, updates):
+        """
+        Update SMS status for many leads with a single API call.
+
+        updates: list of dicts with "phone" and optional "sms_sent" (default True),
+        "sms_date" and "notes" keys
+
+        Returns: number of leads that were found and updated
+        """
+        if not updates:
+            return 0
+        try:
+            phone_to_row = self._ensure_phone_index()
+            ranges = []
+            updated = 0
+            for update in updates:
+                phone = update.get("phone", "")
+                i = phone_to_row.get(phone_key(phone))
+                if not i:
+                    logger.warning(f"Lead not found with phone: {phone}")
+                    continue
+                ranges.extend(self._sms_status_ranges(
+                    i,
+                    update.get("sms_sent", True),
+                    update.get("sms_date"),
+                    update.get("notes", ""),
+                ))
+                updated += 1
+
+            if ranges:
+                self._retry_with_backoff(self.sheet.batch_update, ranges)
+                self._values_cache = None
+                logger.info(f"Updated SMS status for {updated} leads")
+            return updated
+
+        except Exception as e:
+            # These leads were already texted; list them so they can be
+            # marked by hand instead of being messaged again next run
+            phones = ", ".join(update.get("phone", "") for update in updates)
+            logger.error(f"Error updating SMS statuses: {e}. Still marked unsent: {phones}")
+            return 0
+
     def get_all_leads(self):
         """Return all leads as list[dict]"""
         try:
-            all_values = self.sheet.get_all_values()
+            all_values = self._get_all_values()
             if not all_values:
                 return []
-            headers = all_values[0]
-            leads = []
-            for row in all_values[1:]:
-                lead = dict(zip(headers, row))
-                leads.append(lead)
-            return leads
+            headers = tuple(all_values[0])
+            return [dict(zip(headers, row)) for row in all_values[1:]]
         except Exception as e:
             logger.error(f"Error getting leads: {e}")
             return []
 
     def get_leads_without_sms(self):
-        """Return leads that have not been sent SMS yet"""
+        """
+        Return leads that have not been sent SMS yet.
+        API errors are logged and raised, so a failed read is never mistaken
+        for "no leads left to message".
+        """
+        def unsent(all_values):
+            if not all_values:
+                return []
+            headers = tuple(all_values[0])
+            leads = (dict(zip(headers, row)) for row in all_values[1:])
+            return [lead for lead in leads if lead.get("SMS Sent", "").strip().lower() != "yes"]
+
         try:
-            all_leads = self.get_all_leads()
+            if self._values_cache is not None:
+                return unsent(self._values_cache)
+
+            # Read the SMS Sent column (11: K) first, then fetch only the rows
+            # that still need a message - usually a short run at the bottom
+            sms_col = self._retry_with_backoff(self.sheet.col_values, 11) or []
+            rows = [
+                i for i, value in enumerate(sms_col[1:], start=2)
+                if (value or "").strip().lower() != "yes"
+            ]
+            ranges = ["A1:M1"]  # header
+            for _, run in itertools.groupby(enumerate(rows), key=lambda p: p[1] - p[0]):
+                run = [row for _, row in run]
+                ranges.append(f"A{run[0]}:M{run[-1]}")
+                if len(ranges) > MAX_BATCH_GET_RANGES:
+                    # Unsent rows are scattered; one full read is cheaper
+                    return unsent(self._get_all_values())
+            # Rows past the last filled SMS Sent cell have no status at all
+            ranges.append(f"A{max(len(sms_col), 1) + 1}:M")
+
+            value_ranges = self._retry_with_backoff(self.sheet.batch_get, ranges) or []
+            if not value_ranges or not value_ranges[0]:
+                return []
+            headers = value_ranges[0][0]
             return [
-                lead
-                for lead in all_leads
-                if lead.get("SMS Sent", "").strip().lower() != "yes"
+                dict(zip(headers, row))
+                for value_range in value_ranges[1:]
+                for row in value_range
+                if row
             ]
         except Exception as e:
             logger.error(f"Error getting leads without SMS: {e}")
-            return []
-
-
+            raise
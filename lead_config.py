@@ -17,6 +17,11 @@ TWILIO_ACCOUNT_SID = os.getenv("TWILIO_ACCOUNT_SID", "")
 TWILIO_AUTH_TOKEN = os.getenv("TWILIO_AUTH_TOKEN", "")
 TWILIO_PHONE_NUMBER = os.getenv("TWILIO_PHONE_NUMBER", "")  # Your Twilio number
 
+# A Twilio long-code number sends about 1 message per second; messages are
+# spaced SMS_SEND_DELAY seconds apart with up to SMS_SEND_WORKERS in flight
+SMS_SEND_DELAY = 1.0
+SMS_SEND_WORKERS = 4
+
 # ----------------- Email SMTP (optional) ---------
 # Fill these in your .env if you want email sending later
 EMAIL_SMTP_HOST = os.getenv("EMAIL_SMTP_HOST", "")      # e.g. "smtp.gmail.com"
@@ -53,12 +58,27 @@ BUSINESS_CATEGORIES = [
 MAX_RESULTS_PER_CATEGORY = 10  # 10 leads per category
 DELAY_BETWEEN_REQUESTS = 12     # seconds between searches (increased for stability)
 
+# Number of Chrome windows searching in parallel. Each one waits
+# DELAY_BETWEEN_REQUESTS between its own searches.
+SCRAPER_POOL_SIZE = 3
+
+# On a CAPTCHA the browser waits up to 5 minutes for someone to solve it.
+# Set this to True to fail that search straight away instead.
+SCRAPER_UNATTENDED = False
+
 # Two-pass strategy:
 # 1) Fast list scrape
 # 2) Click-into-detail for leads missing phone numbers OR websites
 ENRICH_MISSING_PHONES = True
 ENRICH_MAX_CLICKS_PER_SEARCH = 100  # High limit to ensure we get ALL missing phones/websites
 
+# Leads are written to Google Sheets in batches of this size while scraping
+SHEETS_SAVE_BATCH_SIZE = 500
+
+# Phones/websites found on earlier runs are reused instead of clicking again
+SCRAPE_CACHE_FILE = ".scrape_cache.json"
+SCRAPE_CACHE_TTL_DAYS = 7
+
 # ----------------- SMS Template ------------------
 SMS_MESSAGE_TEMPLATE = """Hello {business_name},
 
@@ -3,13 +3,16 @@ Main Lead Scraper Script
 Orchestrates scraping, saving to Google Sheets, and sending SMS
 """
 
+import asyncio
+import itertools
 import logging
 import time
 import random
 import os
-from google_maps_scraper import GoogleMapsScraper
-from google_sheets_manager import GoogleSheetsManager
-from sms_sender import SMSSender
+import sys
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from scrape_cache import ScrapeCache
 import lead_config as config
 
 logging.basicConfig(
@@ -19,12 +22,56 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _batched(iterable, size):
+    """Yield lists of up to `size` items from `iterable`"""
+    iterator = iter(iterable)
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def create_sheets_manager():
+    """Connect to the configured Google Sheet"""
+    # Imported here so gspread only loads when a sheet is actually needed
+    from google_sheets_manager import GoogleSheetsManager
+
+    logger.info("Initializing Google Sheets Manager...")
+    return GoogleSheetsManager(
+        credentials_file=config.GOOGLE_SHEETS_CREDENTIALS_FILE,
+        sheet_id=config.GOOGLE_SHEET_ID,
+        sheet_name=config.GOOGLE_SHEET_NAME
+    )
+
+
+def create_sms_sender():
+    """Create the Twilio SMS sender from the configured credentials"""
+    from sms_sender import SMSSender
+
+    logger.info("Initializing SMS Sender...")
+    if not config.TWILIO_ACCOUNT_SID or not config.TWILIO_AUTH_TOKEN:
+        logger.warning("⚠️  Twilio credentials not found in .env file. SMS sending will be disabled.")
+    return SMSSender(
+        account_sid=config.TWILIO_ACCOUNT_SID,
+        auth_token=config.TWILIO_AUTH_TOKEN,
+        from_number=config.TWILIO_PHONE_NUMBER
+    )
+
+
 class LeadScraper:
-    def __init__(self):
-        """Initialize the Lead Scraper with all components"""
-        self.scraper = None
-        self.sheets_manager = None
-        self.sms_sender = None
+    def __init__(self, sheets_manager=None, sms_sender=None):
+        """
+        Initialize the Lead Scraper with all components
+
+        Args:
+            sheets_manager: Already connected GoogleSheetsManager to reuse (optional)
+            sms_sender: Already initialized SMSSender to reuse (optional)
+        """
+        self.scrapers = None
+        self.sheets_manager = sheets_manager
+        self.sms_sender = sms_sender
+        self.cache = None
         self.all_leads = []
 
         # Initialize components
@@ -39,26 +86,20 @@ class LeadScraper:
                 logger.error(error_msg)
                 raise FileNotFoundError(error_msg)
             
-            # Initialize Google Maps Scraper
-            logger.info("Initializing Google Maps Scraper...")
-            self.scraper = GoogleMapsScraper(headless=False)
+            # The Google Maps scraper pool is launched on first use
+            # (see _ensure_scrapers), so SMS-only runs never start Chrome
 
             # Initialize Google Sheets Manager
-            logger.info("Initializing Google Sheets Manager...")
-            self.sheets_manager = GoogleSheetsManager(
-                credentials_file=config.GOOGLE_SHEETS_CREDENTIALS_FILE,
-                sheet_id=config.GOOGLE_SHEET_ID,
-                sheet_name=config.GOOGLE_SHEET_NAME
-            )
+            if self.sheets_manager is None:
+                self.sheets_manager = create_sheets_manager()
 
             # Initialize SMS Sender
-            logger.info("Initializing SMS Sender...")
-            if not config.TWILIO_ACCOUNT_SID or not config.TWILIO_AUTH_TOKEN:
-                logger.warning("⚠️  Twilio credentials not found in .env file. SMS sending will be disabled.")
-            self.sms_sender = SMSSender(
-                account_sid=config.TWILIO_ACCOUNT_SID,
-                auth_token=config.TWILIO_AUTH_TOKEN,
-                from_number=config.TWILIO_PHONE_NUMBER
+            if self.sms_sender is None:
+                self.sms_sender = create_sms_sender()
+
+            self.cache = ScrapeCache(
+                path=config.SCRAPE_CACHE_FILE,
+                ttl_seconds=config.SCRAPE_CACHE_TTL_DAYS * 86400,
             )
 
             logger.info("All components initialized successfully")
@@ -67,8 +108,37 @@ class LeadScraper:
             logger.error(f"Error initializing components: {e}")
             raise
 
+    def _ensure_scrapers(self):
+        """Launch the Google Maps scraper pool (one Chrome per pool slot) if it is not running"""
+        if self.scrapers is None:
+            from google_maps_scraper import GoogleMapsScraperPool
+
+            logger.info("Initializing Google Maps Scraper pool...")
+            self.scrapers = GoogleMapsScraperPool(
+                size=config.SCRAPER_POOL_SIZE,
+                headless=False,
+                unattended=config.SCRAPER_UNATTENDED,
+            )
+        else:
+            # The browsers are closed at the end of every run; relaunch them when reused
+            self.scrapers.start()
+
     def scrape_leads(self):
         """Scrape leads from Google Maps for all categories and locations"""
+        # Keep ALL leads - no deduplication (you can filter duplicates in Google Sheets if needed)
+        self.all_leads = list(self.iter_leads())
+        return self.all_leads
+
+    def iter_leads(self):
+        """
+        Scrape leads from Google Maps for all categories and locations,
+        yielding each lead as soon as its search (and enrichment) is done.
+        Searches run on config.SCRAPER_POOL_SIZE browsers at once, and only
+        a few searches ahead of the one being consumed are queued, so memory
+        stays bounded by the pool size rather than the number of searches.
+        """
+        self._ensure_scrapers()
+
         logger.info("=" * 70)
         logger.info("🚀 Starting lead scraping process...")
         logger.info("=" * 70)
@@ -82,95 +152,76 @@ class LeadScraper:
         logger.info(f"📊 Expected total: ~{len(config.SEARCH_LOCATIONS) * len(config.BUSINESS_CATEGORIES) * config.MAX_RESULTS_PER_CATEGORY} leads")
         logger.info("=" * 70 + "\n")
         
-        all_leads = []
+        total_leads = 0
         
         # Track statistics
         stats = {}
-        category_stats = {}  # Track stats per category
+        category_stats = defaultdict(Counter)  # Track stats per category (total/successful/zero/failed)
         total_searches = len(config.SEARCH_LOCATIONS) * len(config.BUSINESS_CATEGORIES)
         successful_searches = 0
         failed_searches = 0
         zero_result_searches = 0
 
-        for location in config.SEARCH_LOCATIONS:
+        category_lead_counts = Counter()
+
+        # Searches run concurrently across the scraper pool; results are
+        # consumed here in the original location/category order
+        jobs = [
+            (category, location)
+            for location in config.SEARCH_LOCATIONS
+            for category in config.BUSINESS_CATEGORIES
+        ]
+        results = zip(jobs, self.scrapers.run_many(self._scrape_search, jobs))
+
+        for location, location_results in itertools.groupby(results, key=lambda r: r[0][1]):
             logger.info(f"\n{'=' * 50}")
             logger.info(f"Searching in location: {location}")
             logger.info(f"{'=' * 50}\n")
             
             location_leads = 0
 
-            for category in config.BUSINESS_CATEGORIES:
+            for (category, _), search in location_results:
                 logger.info(f"\n{'─' * 60}")
-                logger.info(f"🔍 Searching for: '{category}' in '{location}'")
+                logger.info(f"🔍 Results for: '{category}' in '{location}'")
                 logger.info(f"{'─' * 60}")
 
-                try:
-                    # Pass 1: fast list-only scrape
-                    businesses = self.scraper.search_businesses(
-                        query=category,
-                        location=location,
-                        max_results=config.MAX_RESULTS_PER_CATEGORY
-                    )
-
-                    # Track results
-                    category_key = f"{category}"
-                    if category_key not in category_stats:
-                        category_stats[category_key] = {"total": 0, "successful": 0, "zero": 0, "failed": 0}
-                    
-                    if len(businesses) == 0:
-                        zero_result_searches += 1
-                        category_stats[category_key]["zero"] += 1
-                        logger.warning(f"⚠️  Found 0 results for '{category}' in '{location}'")
-                        logger.warning(f"   Possible causes: No businesses match this category, CAPTCHA blocking, or search query issue")
-                    else:
-                        successful_searches += 1
-                        location_leads += len(businesses)
-                        category_stats[category_key]["total"] += len(businesses)
-                        category_stats[category_key]["successful"] += 1
-                        logger.info(f"   ✅ Successfully found {len(businesses)} leads")
-
-                    # Optional Pass 2: enrich only leads that are missing phone numbers
-                    if config.ENRICH_MISSING_PHONES and len(businesses) > 0:
-                        businesses = self.scraper.enrich_missing_phones(
-                            leads=businesses,
-                            query=category,
-                            location=location,
-                            max_clicks=getattr(
-                                config,
-                                "ENRICH_MAX_CLICKS_PER_SEARCH",
-                                20,
-                            ),
-                        )
-
-                    # Add location and search category to each business
-                    for business in businesses:
-                        business["search_location"] = location
-                        business["search_category"] = category
-
-                    all_leads.extend(businesses)
-                    logger.info(f"✅ Found {len(businesses)}/{config.MAX_RESULTS_PER_CATEGORY} businesses for {category} in {location}")
-
-                    # Random delay between searches to appear more human-like and avoid rate limiting
-                    # Adds 0-3 seconds randomly to the base delay
-                    random_delay = config.DELAY_BETWEEN_REQUESTS + random.uniform(0, 3)
-                    logger.debug(f"Waiting {random_delay:.1f} seconds before next search...")
-                    time.sleep(random_delay)
+                category_key = f"{category}"
 
+                try:
+                    found, businesses = search.result()
                 except Exception as e:
                     failed_searches += 1
-                    category_key = f"{category}"
-                    if category_key not in category_stats:
-                        category_stats[category_key] = {"total": 0, "successful": 0, "zero": 0, "failed": 0}
                     category_stats[category_key]["failed"] += 1
                     logger.error(f"❌ Error searching for '{category}' in '{location}': {e}")
                     logger.error(f"   This search will be skipped. Check logs above for details.")
                     import traceback
                     logger.debug(traceback.format_exc())
                     continue
+
+                # Track results
+                if found == 0:
+                    zero_result_searches += 1
+                    category_stats[category_key]["zero"] += 1
+                    logger.warning(f"⚠️  Found 0 results for '{category}' in '{location}'")
+                    logger.warning(f"   Possible causes: No businesses match this category, CAPTCHA blocking, or search query issue")
+                else:
+                    successful_searches += 1
+                    location_leads += found
+                    category_stats[category_key]["total"] += found
+                    category_stats[category_key]["successful"] += 1
+                    logger.info(f"   ✅ Successfully found {found} leads")
+
+                total_leads += len(businesses)
+                category_lead_counts[category] += len(businesses)
+                logger.info(f"✅ Found {len(businesses)}/{config.MAX_RESULTS_PER_CATEGORY} businesses for {category} in {location}")
+
+                yield from businesses
             
             stats[location] = location_leads
             logger.info(f"📍 Total for {location}: {location_leads} leads")
 
+        self.cache.save()
+
         # Print summary
         logger.info(f"\n{'=' * 70}")
         logger.info("📊 SCRAPING SUMMARY")
@@ -185,15 +236,10 @@ class LeadScraper:
         
         # Category breakdown - detailed stats
         logger.info(f"\n📋 Detailed results by category:")
-        category_lead_counts = {}
-        for lead in all_leads:
-            cat = lead.get("search_category", "Unknown")
-            category_lead_counts[cat] = category_lead_counts.get(cat, 0) + 1
-        
         # Show stats for each category
         for cat in config.BUSINESS_CATEGORIES:
-            lead_count = category_lead_counts.get(cat, 0)
-            stats = category_stats.get(cat, {"total": 0, "successful": 0, "zero": 0, "failed": 0})
+            lead_count = category_lead_counts[cat]
+            stats = category_stats[cat]
             logger.info(f"   {cat}:")
             logger.info(f"      Leads collected: {lead_count}")
             logger.info(f"      Successful searches: {stats['successful']}/{len(config.SEARCH_LOCATIONS)}")
@@ -203,17 +249,62 @@ class LeadScraper:
                 logger.warning(f"      ⚠️  WARNING: This category returned 0 results in ALL locations!")
         
         logger.info(f"\n{'=' * 70}")
-        logger.info(f"🎯 TOTAL LEADS COLLECTED: {len(all_leads)}")
+        logger.info(f"🎯 TOTAL LEADS COLLECTED: {total_leads}")
         expected = total_searches * config.MAX_RESULTS_PER_CATEGORY
         if expected > 0:
-            percentage = (len(all_leads) / expected) * 100
+            percentage = (total_leads / expected) * 100
             logger.info(f"Expected: ~{expected} leads")
-            logger.info(f"Actual: {len(all_leads)} leads ({percentage:.1f}% of expected)")
+            logger.info(f"Actual: {total_leads} leads ({percentage:.1f}% of expected)")
         logger.info(f"{'=' * 70}\n")
 
-        # Keep ALL leads - no deduplication (you can filter duplicates in Google Sheets if needed)
-        self.all_leads = all_leads
-        return all_leads
+    def _scrape_search(self, scraper, category, location):
+        """
+        Run one category/location search (plus enrichment) on a pool scraper.
+
+        Returns: (number of results from the list scrape, enriched leads)
+        """
+        logger.info(f"🔍 Searching for: '{category}' in '{location}'")
+
+        # Pass 1: fast list-only scrape
+        businesses = scraper.search_businesses(
+            query=category,
+            location=location,
+            max_results=config.MAX_RESULTS_PER_CATEGORY
+        )
+        found = len(businesses)
+
+        # Reuse phones/websites found on earlier runs
+        cache_hits = self.cache.apply(businesses)
+        if cache_hits:
+            logger.info(f"   ♻️  Filled {cache_hits} leads from scrape cache")
+
+        # Optional Pass 2: enrich only leads that are missing phone numbers
+        if config.ENRICH_MISSING_PHONES and len(businesses) > 0:
+            businesses = scraper.enrich_missing_phones(
+                leads=businesses,
+                query=category,
+                location=location,
+                max_clicks=getattr(
+                    config,
+                    "ENRICH_MAX_CLICKS_PER_SEARCH",
+                    20,
+                ),
+            )
+
+        self.cache.update(businesses)
+
+        # Add location and search category to each business
+        for business in businesses:
+            business["search_location"] = location
+            business["search_category"] = category
+
+        # Random delay before this browser's next search to appear more human-like
+        # and avoid rate limiting. Adds 0-3 seconds randomly to the base delay
+        random_delay = config.DELAY_BETWEEN_REQUESTS + random.uniform(0, 3)
+        logger.debug(f"Waiting {random_delay:.1f} seconds before next search...")
+        time.sleep(random_delay)
+
+        return found, businesses
 
     def remove_duplicates(self, leads):
         """
@@ -221,6 +312,8 @@ class LeadScraper:
         This is less aggressive - we only remove if it's the exact same phone number.
         Different businesses with same name but different locations will be kept.
         """
+        from google_sheets_manager import normalize_phone
+
         seen_phones = set()
         unique_leads = []
         skipped_count = 0
@@ -231,7 +324,7 @@ class LeadScraper:
             # Only dedupe if we have a valid phone number
             if phone and phone != "N/A" and phone.strip():
                 # Normalize phone (remove spaces, dashes, etc. for comparison)
-                normalized_phone = ''.join(filter(str.isdigit, phone))
+                normalized_phone = normalize_phone(phone)
                 if normalized_phone in seen_phones:
                     skipped_count += 1
                     continue
@@ -246,15 +339,11 @@ class LeadScraper:
         return unique_leads
 
     def save_leads_to_sheets(self, leads):
-        """Save leads to Google Sheets using efficient batch insert"""
-        # Get existing leads count before saving
-        try:
-            existing_leads = self.sheets_manager.get_all_leads()
-            existing_leads_count = len(existing_leads)
-        except Exception as e:
-            logger.warning(f"Could not get existing leads count: {e}")
-            existing_leads_count = 0
-
+        """
+        Save leads to Google Sheets using efficient batch insert.
+        Called once per streamed batch, so it reports only what add_leads_batch
+        returns rather than re-reading the whole sheet for before/after totals.
+        """
         logger.info(f"\n{'=' * 70}")
         logger.info(f"💾 SAVING LEADS TO GOOGLE SHEETS")
         logger.info(f"{'=' * 70}")
@@ -269,12 +358,10 @@ class LeadScraper:
             print(f"\n{'=' * 70}")
             print(f"📊 GOOGLE SHEETS SAVE RESULTS")
             print(f"{'=' * 70}")
-            print(f"📋 Existing leads before this run: {existing_leads_count}")
             print(f"✅ New leads added: {added}")
             print(f"⏭️  Skipped (duplicates/invalid): {skipped}")
             if failed > 0:
                 print(f"❌ Failed to save: {failed}")
-            print(f"🎯 Total leads after this run: {existing_leads_count + added}")
             print(f"{'=' * 70}\n")
 
             if failed > 0:
@@ -300,12 +387,13 @@ class LeadScraper:
 
             return saved_count
 
-    def send_sms_to_leads(self, send_to_all: bool = False):
+    def send_sms_to_leads(self, send_to_all: bool = False, auto_confirm: bool = False):
         """
         Send SMS to leads
 
         Args:
             send_to_all: If True, send to all leads. If False, only send to leads without SMS
+            auto_confirm: If True, send without asking for confirmation first
         """
         logger.info("\nPreparing to send SMS messages...")
 
@@ -333,37 +421,43 @@ class LeadScraper:
             logger.warning("No leads with valid phone numbers found.")
             return
 
-        # Confirm before sending
-        print(f"\n{'=' * 50}")
-        print(f"Ready to send SMS to {len(valid_leads)} leads")
-        print(f"{'=' * 50}")
-        response = input("Do you want to proceed? (yes/no): ").strip().lower()
+        # Confirm before sending (never wait on a prompt nobody can answer)
+        if not auto_confirm:
+            if not sys.stdin.isatty():
+                logger.error("Refusing to prompt for SMS confirmation in non-interactive mode, pass --yes")
+                return
 
-        if response != "yes":
-            logger.info("SMS sending cancelled by user.")
-            return
+            print(f"\n{'=' * 50}")
+            print(f"Ready to send SMS to {len(valid_leads)} leads")
+            print(f"{'=' * 50}")
+            response = input("Do you want to proceed? (yes/no): ").strip().lower()
+
+            if response != "yes":
+                logger.info("SMS sending cancelled by user.")
+                return
 
         # Send SMS
         logger.info("Sending SMS messages...")
         results = self.sms_sender.send_bulk_sms(
             leads=valid_leads,
             message_template=config.SMS_MESSAGE_TEMPLATE,
-            delay=config.DELAY_BETWEEN_REQUESTS
+            delay=config.SMS_SEND_DELAY,
+            max_workers=config.SMS_SEND_WORKERS,
         )
 
         # Update Google Sheets with SMS status
         successful = 0
         failed = 0
+        status_updates = []
 
         for result in results:
             if result.get("success"):
                 successful += 1
-                # Update sheet
-                self.sheets_manager.update_lead_sms_status(
-                    phone=result.get("to", ""),
-                    sms_sent=True,
-                    sms_date=result.get("date_sent", "")
-                )
+                status_updates.append({
+                    "phone": result.get("to", ""),
+                    "sms_sent": True,
+                    "sms_date": result.get("date_sent", ""),
+                })
             else:
                 failed += 1
                 logger.warning(
@@ -371,31 +465,48 @@ class LeadScraper:
                     f"{result.get('error', 'Unknown error')}"
                 )
 
+        # Write every sent status to the sheet in one request
+        marked = self.sheets_manager.update_lead_sms_status_bulk(status_updates)
+        if marked != successful:
+            logger.error(
+                f"❌ Only {marked} of {successful} sent SMS were marked in the sheet. "
+                f"Mark the rest by hand or they will be texted again on the next run."
+            )
+
         logger.info(f"\nSMS sending complete!")
         logger.info(f"Successful: {successful}")
         logger.info(f"Failed: {failed}")
 
-    def run_full_pipeline(self, send_sms: bool = False):
+    def run_full_pipeline(self, send_sms: bool = False, auto_confirm: bool = False):
         """
         Run the complete lead scraping pipeline
 
         Args:
             send_sms: Whether to send SMS after scraping (default: False)
+            auto_confirm: Send the SMS without asking for confirmation (default: False)
         """
         try:
-            # Step 1: Scrape leads
-            leads = self.scrape_leads()
-
-            if not leads:
+            # Step 1 + 2: Scrape leads and save them to Google Sheets in batches.
+            # Saving runs on a background thread so the browser keeps scraping
+            # while the previous batch is uploaded (one worker keeps row order).
+            total_leads = 0
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                saves = []
+                for batch in _batched(self.iter_leads(), config.SHEETS_SAVE_BATCH_SIZE):
+                    saves.append(executor.submit(self.save_leads_to_sheets, batch))
+                    total_leads += len(batch)
+                for save in saves:
+                    save.result()
+
+            if not total_leads:
                 logger.warning("No leads found. Exiting.")
                 return
 
-            # Step 2: Save to Google Sheets
-            self.save_leads_to_sheets(leads)
-
-            # Step 3: Send SMS (if requested)
+            # Step 3: Send SMS (if requested). The browsers are done by now;
+            # don't keep them open while waiting for confirmation
             if send_sms:
-                self.send_sms_to_leads(send_to_all=False)
+                self.scrapers.close()
+                self.send_sms_to_leads(send_to_all=False, auto_confirm=auto_confirm)
 
             logger.info("\n" + "=" * 50)
             logger.info("Lead scraping pipeline completed successfully!")
@@ -406,13 +517,26 @@ class LeadScraper:
             raise
         finally:
             # Cleanup
-            if self.scraper:
-                self.scraper.close()
+            if self.scrapers:
+                self.scrapers.close()
+
+    async def run_full_pipeline_async(self, send_sms: bool = False, auto_confirm: bool = False):
+        """
+        Async entry point for the pipeline.
+
+        Selenium and gspread are blocking libraries, so the pipeline runs in a
+        worker thread and the event loop stays free while it waits on I/O.
+
+        Args:
+            send_sms: Whether to send SMS after scraping (default: False)
+            auto_confirm: Send the SMS without asking for confirmation (default: False)
+        """
+        await asyncio.to_thread(self.run_full_pipeline, send_sms=send_sms, auto_confirm=auto_confirm)
 
     def cleanup(self):
         """Cleanup resources"""
-        if self.scraper:
-            self.scraper.close()
+        if self.scrapers:
+            self.scrapers.close()
         logger.info("Cleanup complete")
 
 
@@ -431,23 +555,34 @@ def main():
         action="store_true",
         help="Only send SMS to existing leads (skip scraping)",
     )
+    parser.add_argument(
+        "--yes",
+        action="store_true",
+        help="Send SMS without asking for confirmation (for cron/unattended runs)",
+    )
 
     args = parser.parse_args()
 
     scraper = LeadScraper()
+    exit_code = 0
 
     try:
         if args.sms_only:
-            scraper.send_sms_to_leads(send_to_all=False)
+            scraper.send_sms_to_leads(send_to_all=False, auto_confirm=args.yes)
         else:
-            scraper.run_full_pipeline(send_sms=args.send_sms)
+            scraper.run_full_pipeline(send_sms=args.send_sms, auto_confirm=args.yes)
     except KeyboardInterrupt:
         logger.info("\nProcess interrupted by user.")
     except Exception as e:
         logger.error(f"Fatal error: {e}")
+        exit_code = 1
     finally:
         scraper.cleanup()
+        if scraper.sms_sender:
+            scraper.sms_sender.close()
+
+    return exit_code
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,109 @@
+"""
+Scrape Cache
+Persists enriched lead details between runs so the autopilot does not
+click into the same businesses again every day
+"""
+import json
+import logging
+import os
+import time
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+CACHED_FIELDS = ("phone", "website")
+
+
+class ScrapeCache:
+    def __init__(self, path, ttl_seconds):
+        """
+        Initialize the on-disk cache
+
+        Args:
+            path: JSON file used to store cached lead details
+            ttl_seconds: How long a cached entry stays valid
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.entries = {}
+        self.load()
+
+    def load(self):
+        """Load cache entries from disk, dropping anything expired"""
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+            cutoff = time.time() - self.ttl_seconds
+            self.entries = {
+                key: entry
+                for key, entry in entries.items()
+                if entry.get("cached_at", 0) >= cutoff
+            }
+            logger.info(f"Loaded {len(self.entries)} cached leads from {self.path}")
+        except Exception as e:
+            logger.warning(f"Could not load scrape cache ({self.path}): {e}")
+            self.entries = {}
+
+    def save(self):
+        """Write cache entries to disk"""
+        try:
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.entries, f)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.warning(f"Could not save scrape cache ({self.path}): {e}")
+
+    @staticmethod
+    def _key(lead):
+        name = (lead.get("name") or "").strip().lower()
+        address = (lead.get("address") or "").strip().lower()
+        if not name or name == "n/a":
+            return None
+        return f"{name}|{address}"
+
+    def apply(self, leads):
+        """
+        Fill missing phone/website fields from the cache.
+
+        Returns: number of leads that got at least one field from the cache
+        """
+        hits = 0
+        for lead in leads:
+            key = self._key(lead)
+            entry = self.entries.get(key) if key else None
+            if not entry:
+                continue
+            updated = False
+            for field in CACHED_FIELDS:
+                value = entry.get(field, "N/A")
+                if value != "N/A" and (not lead.get(field) or lead[field] == "N/A"):
+                    lead[field] = value
+                    updated = True
+            if updated:
+                hits += 1
+        return hits
+
+    def update(self, leads):
+        """
+        Store phone/website details we know for these leads.
+        An entry keeps its original cached_at unless the lead brings new
+        values, so details copied in by apply() still expire after the TTL.
+        """
+        now = time.time()
+        for lead in leads:
+            key = self._key(lead)
+            if not key:
+                continue
+            values = {
+                field: lead.get(field) or "N/A" for field in CACHED_FIELDS
+            }
+            if all(value == "N/A" for value in values.values()):
+                continue
+            entry = self.entries.get(key)
+            if entry and all(entry.get(field, "N/A") == values[field] for field in CACHED_FIELDS):
+                continue
+            values["cached_at"] = now
+            self.entries[key] = values
@@ -2,15 +2,31 @@
 SMS Sender using Twilio
 Handles sending SMS messages to leads
 """
-from twilio.rest import Client
+from twilio.base.exceptions import TwilioRestException
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 import logging
 from datetime import datetime
 import re
+import threading
 import time
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+HTTP_POOL_SIZE = 8  # keep-alive connections to the Twilio API (>= send workers)
+
+# Twilio answers 429 (too many requests) and 503 (unavailable) without
+# accepting the message, so those are safe to retry. Other errors are not
+# retried: the message may already have gone out.
+RETRYABLE_STATUS_CODES = {429, 503}
+MAX_SEND_ATTEMPTS = 3
+BASE_RETRY_DELAY = 1  # seconds, doubled after each attempt
+MAX_RETRY_DELAY = 8  # seconds
+
+# Everything except digits and "+" is dropped before formatting to E.164
+PHONE_STRIP_RE = re.compile(r'[^\d+]')
+
 
 class SMSSender:
     def __init__(self, account_sid, auth_token, from_number):
@@ -25,17 +41,50 @@ class SMSSender:
         self.account_sid = account_sid
         self.auth_token = auth_token
         self.from_number = from_number
-        self.client = None
+        # The Twilio client is built on first use (see the client property)
+        self._client = None
+        self._client_failed = False
+        self.client_error = None  # why the client could not be built, if it failed
+        self._client_lock = threading.Lock()
+        self.http_client = None
         
-        if account_sid and auth_token:
-            try:
-                self.client = Client(account_sid, auth_token)
-                logger.info("Twilio client initialized")
-            except Exception as e:
-                logger.error(f"Error initializing Twilio client: {e}")
-        else:
+        if not (account_sid and auth_token):
             logger.warning("Twilio credentials not provided. SMS sending will be disabled.")
     
+    @property
+    def client(self):
+        """Twilio client, created (and the Twilio SDK imported) the first time it is needed"""
+        if self._client is None and not self._client_failed and self.account_sid and self.auth_token:
+            with self._client_lock:  # send workers may all ask for it at once
+                if self._client is None and not self._client_failed:
+                    try:
+                        from twilio.http.http_client import TwilioHttpClient
+                        from twilio.rest import Client
+                        
+                        # One keep-alive session for every message, sized for all send workers
+                        self.http_client = TwilioHttpClient(pool_connections=True)
+                        self.http_client.session.mount(
+                            "https://", HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_SIZE)
+                        )
+                        self._client = Client(self.account_sid, self.auth_token, http_client=self.http_client)
+                        logger.info("Twilio client initialized")
+                    except Exception as e:
+                        self._client_failed = True
+                        self.client_error = e
+                        logger.error(f"Error initializing Twilio client: {e}")
+        return self._client
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def close(self):
+        """Close the pooled connections to the Twilio API"""
+        if self.http_client and self.http_client.session:
+            self.http_client.session.close()
+    
     def format_phone_number(self, phone):
         """
         Format phone number to E.164 format for Twilio
@@ -50,7 +99,7 @@ class SMSSender:
             return None
         
         # Remove all non-digit characters except +
-        cleaned = re.sub(r'[^\d+]', '', phone)
+        cleaned = PHONE_STRIP_RE.sub('', phone)
         
         # If it doesn't start with +, assume US number
         if not cleaned.startswith('+'):
@@ -64,13 +113,15 @@ class SMSSender:
         
         return cleaned
     
-    def send_sms(self, to_number, message):
+    def send_sms(self, to_number, message, wait_for_turn=None):
         """
         Send SMS message
         
         Args:
             to_number: Recipient phone number
             message: Message text
+            wait_for_turn: Optional callable that blocks until the next send
+                slot; called before every attempt, retries included
             
         Returns:
             Dictionary with status information or None if failed
@@ -85,12 +136,26 @@ class SMSSender:
                 logger.warning(f"Could not format phone number: {to_number}")
                 return None
             
-            # Send SMS
-            message_obj = self.client.messages.create(
-                body=message,
-                from_=self.from_number,
-                to=formatted_number
-            )
+            # Send SMS, backing off when Twilio is throttling us
+            for attempt in range(MAX_SEND_ATTEMPTS):
+                if wait_for_turn:
+                    wait_for_turn()
+                try:
+                    message_obj = self.client.messages.create(
+                        body=message,
+                        from_=self.from_number,
+                        to=formatted_number
+                    )
+                    break
+                except TwilioRestException as e:
+                    if e.status not in RETRYABLE_STATUS_CODES or attempt == MAX_SEND_ATTEMPTS - 1:
+                        raise
+                    delay = min(BASE_RETRY_DELAY * (2 ** attempt), MAX_RETRY_DELAY)
+                    logger.warning(
+                        f"Twilio returned {e.status} for {formatted_number}. "
+                        f"Retrying in {delay}s ({attempt + 1}/{MAX_SEND_ATTEMPTS})..."
+                    )
+                    time.sleep(delay)
             
             logger.info(f"SMS sent successfully to {formatted_number}. SID: {message_obj.sid}")
             
@@ -110,45 +175,64 @@ class SMSSender:
                 'to': to_number
             }
     
-    def send_bulk_sms(self, leads, message_template, delay=2):
+    def send_bulk_sms(self, leads, message_template, delay=2, max_workers=1):
         """
         Send SMS to multiple leads
         
         Args:
             leads: List of lead dictionaries
             message_template: Message template with {business_name} placeholder
-            delay: Delay between messages in seconds
+            delay: Minimum seconds between the start of two messages
+            max_workers: How many messages may be in flight at once
             
         Returns:
-            List of results for each SMS sent
+            List of results for each SMS sent (in lead order)
         """
-        results = []
-        
-        for lead in leads:
+        # Messages are started at most once per `delay` seconds across all
+        # workers, so a slow Twilio response no longer holds up the next one
+        pace_lock = threading.Lock()
+        next_send = time.monotonic()
+
+        def wait_for_turn():
+            nonlocal next_send
+            with pace_lock:
+                now = time.monotonic()
+                start = max(now, next_send)
+                next_send = start + delay
+            time.sleep(start - now)
+
+        def send_one(lead):
             # Handle both lowercase (from scraper) and capitalized (from Google Sheets) keys
             phone = lead.get('phone', '') or lead.get('Phone', '')
             business_name = lead.get('name', '') or lead.get('Business Name', 'Business')
             
             if not phone or phone == "N/A":
                 logger.warning(f"No phone number for {business_name}. Skipping.")
-                results.append({
+                return {
                     'success': False,
                     'error': 'No phone number',
                     'business': business_name
-                })
-                continue
+                }
+            
+            # Numbers that can't be sent to are dropped here (format_phone_number
+            # logs them) so they never take up a send slot
+            formatted_number = self.format_phone_number(phone)
+            if not formatted_number:
+                return None
             
             # Format message
             message = message_template.format(business_name=business_name)
             
-            # Send SMS
-            result = self.send_sms(phone, message)
+            # Send SMS (every attempt, retries included, takes a pacing slot)
+            result = self.send_sms(formatted_number, message, wait_for_turn=wait_for_turn)
             if result:
                 result['business'] = business_name
-                results.append(result)
-            
-            # Delay between messages to avoid rate limiting
-            time.sleep(delay)
+            return result
+        
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            results = [result for result in executor.map(send_one, leads) if result]
         
+        sent = sum(1 for result in results if result.get('success'))
+        logger.info(f"Bulk send complete: {sent} sent, {len(results) - sent} failed")
         return results
 
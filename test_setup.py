@@ -2,39 +2,55 @@
 Test script to verify setup and configuration
 Run this before using the main scraper to ensure everything is configured correctly
 """
+import importlib.util
+import io
 import sys
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class _PerThreadStdout:
+    """sys.stdout stand-in that sends each worker thread's prints to its own buffer"""
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+
+    def write(self, text):
+        return (getattr(self.local, "buffer", None) or self.stream).write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+    def __getattr__(self, name):
+        # encoding, isatty(), ... come from the real stream
+        return getattr(self.stream, name)
+
+
+def _run_buffered(stdout, test):
+    """Run one probe on a worker thread; returns (result, everything it printed)"""
+    stdout.local.buffer = io.StringIO()
+    try:
+        return test(), stdout.local.buffer.getvalue()
+    finally:
+        stdout.local.buffer = None
 
 def test_imports():
     """Test if all required packages are installed"""
     print("Testing imports...")
-    try:
-        import selenium
-        print("✓ Selenium installed")
-    except ImportError:
-        print("✗ Selenium not installed. Run: pip install selenium")
-        return False
-    
-    try:
-        import gspread
-        print("✓ gspread installed")
-    except ImportError:
-        print("✗ gspread not installed. Run: pip install gspread")
-        return False
-    
-    try:
-        from twilio.rest import Client
-        print("✓ Twilio installed")
-    except ImportError:
-        print("✗ Twilio not installed. Run: pip install twilio")
-        return False
-    
-    try:
-        from dotenv import load_dotenv
-        print("✓ python-dotenv installed")
-    except ImportError:
-        print("✗ python-dotenv not installed. Run: pip install python-dotenv")
-        return False
+    # find_spec only locates each package; the heavy ones (Selenium, Twilio)
+    # are loaded later by the tests that actually use them
+    packages = [
+        ("selenium", "Selenium", "selenium"),
+        ("gspread", "gspread", "gspread"),
+        ("twilio", "Twilio", "twilio"),
+        ("dotenv", "python-dotenv", "python-dotenv"),
+    ]
+    for module, name, pip_name in packages:
+        if importlib.util.find_spec(module) is None:
+            print(f"✗ {name} not installed. Run: pip install {pip_name}")
+            return False
+        print(f"✓ {name} installed")
     
     return True
 
@@ -42,18 +58,22 @@ def test_config():
     """Test configuration file"""
     print("\nTesting configuration...")
     try:
-        import config
-        print("✓ config.py loaded")
+        import lead_config as config
+        print("✓ lead_config.py loaded")
+        
+        # Read each list once (a missing setting counts as empty)
+        locations = list(getattr(config, "SEARCH_LOCATIONS", None) or [])
+        categories = list(getattr(config, "BUSINESS_CATEGORIES", None) or [])
         
         # Check if locations are set
-        if config.SEARCH_LOCATIONS:
-            print(f"✓ Search locations configured: {len(config.SEARCH_LOCATIONS)} locations")
+        if locations:
+            print(f"✓ Search locations configured: {len(locations)} locations")
         else:
             print("⚠ No search locations configured")
         
         # Check if categories are set
-        if config.BUSINESS_CATEGORIES:
-            print(f"✓ Business categories configured: {len(config.BUSINESS_CATEGORIES)} categories")
+        if categories:
+            print(f"✓ Business categories configured: {len(categories)} categories")
         else:
             print("⚠ No business categories configured")
         
@@ -66,7 +86,7 @@ def test_google_sheets():
     """Test Google Sheets connection"""
     print("\nTesting Google Sheets connection...")
     try:
-        import config
+        import lead_config as config
         from google_sheets_manager import GoogleSheetsManager
         
         if not os.path.exists(config.GOOGLE_SHEETS_CREDENTIALS_FILE):
@@ -76,7 +96,7 @@ def test_google_sheets():
         
         if not config.GOOGLE_SHEET_ID:
             print("✗ Google Sheet ID not configured")
-            print("  Please set GOOGLE_SHEET_ID in config.py or .env")
+            print("  Please set GOOGLE_SHEET_ID in lead_config.py or .env")
             return False
         
         gs = GoogleSheetsManager(
@@ -99,7 +119,7 @@ def test_twilio():
     """Test Twilio configuration"""
     print("\nTesting Twilio configuration...")
     try:
-        import config
+        import lead_config as config
         
         if not config.TWILIO_ACCOUNT_SID:
             print("⚠ Twilio Account SID not configured (SMS will be disabled)")
@@ -124,7 +144,7 @@ def test_twilio():
             print("✓ Twilio client initialized successfully")
             return True
         else:
-            print("⚠ Twilio client not initialized (check credentials)")
+            print(f"⚠ Twilio client not initialized: {sms.client_error or 'check credentials'}")
             return True  # Not blocking
         
     except Exception as e:
@@ -139,17 +159,26 @@ def test_chrome_driver():
         from selenium import webdriver
         from selenium.webdriver.chrome.options import Options
         from selenium.webdriver.chrome.service import Service
-        from webdriver_manager.chrome import ChromeDriverManager
+        from google_maps_scraper import GoogleMapsScraper
         
         chrome_options = Options()
         chrome_options.add_argument('--headless')
         chrome_options.add_argument('--no-sandbox')
         chrome_options.add_argument('--disable-dev-shm-usage')
         
-        service = Service(ChromeDriverManager().install())
+        # Same lookup as the scraper: CHROMEDRIVER_PATH, then a cached
+        # webdriver-manager download, then webdriver-manager itself
+        service = Service(str(GoogleMapsScraper._resolve_driver_path()))
         driver = webdriver.Chrome(service=service, options=chrome_options)
-        driver.get("https://www.google.com")
-        driver.quit()
+        try:
+            # A live session that reports its browser version is proof enough;
+            # no need to load a page (and depend on the network) to check it
+            ok = bool(driver.session_id) and "browserVersion" in driver.capabilities
+        finally:
+            driver.quit()
+        if not ok:
+            print("✗ Chrome started but did not report a browser version")
+            return False
         print("✓ Chrome/ChromeDriver working correctly")
         return True
         
@@ -168,9 +197,26 @@ def main():
     
     results.append(("Imports", test_imports()))
     results.append(("Configuration", test_config()))
-    results.append(("Chrome Driver", test_chrome_driver()))
-    results.append(("Google Sheets", test_google_sheets()))
-    results.append(("Twilio", test_twilio()))
+
+    # The remaining probes wait on Chrome start-up and the network and don't
+    # depend on each other, so they run at the same time. Each one's output is
+    # buffered and printed as a block, in order, once it finishes.
+    probes = [
+        ("Chrome Driver", test_chrome_driver),
+        ("Google Sheets", test_google_sheets),
+        ("Twilio", test_twilio),
+    ]
+    stdout = _PerThreadStdout(sys.stdout)
+    sys.stdout = stdout
+    try:
+        with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+            futures = [(name, executor.submit(_run_buffered, stdout, test)) for name, test in probes]
+            for name, future in futures:
+                result, output = future.result()
+                stdout.stream.write(output)
+                results.append((name, result))
+    finally:
+        sys.stdout = stdout.stream
     
     print("\n" + "=" * 50)
     print("Test Results Summary")
@@ -185,7 +231,7 @@ def main():
     if all_passed:
         print("\n✓ All critical tests passed! You're ready to run the scraper.")
         print("\nNext steps:")
-        print("1. Review and customize config.py")
+        print("1. Review and customize lead_config.py")
         print("2. Run: python main.py")
     else:
         print("\n✗ Some tests failed. Please fix the issues above before running the scraper.")